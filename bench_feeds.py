@@ -0,0 +1,55 @@
+import sqlite3
+import sys
+import time
+import tracemalloc
+from itertools import islice
+
+import feedparser
+
+from main import FEED_CACHE_FILE, iter_feed_entries
+
+# feed_cache.db에 기록된 피드 본문으로 빠른 경로(iter_feed_entries)와 feedparser.parse를 비교합니다.
+# 사용법: python bench_feeds.py [항목 수 제한(기본 5)] [반복 횟수(기본 5)]
+
+def measure(func, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, best, peak
+
+def main():
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    conn = sqlite3.connect(FEED_CACHE_FILE)
+    rows = conn.execute("SELECT url, body FROM feed_cache WHERE body IS NOT NULL ORDER BY url").fetchall()
+    conn.close()
+    if not rows:
+        print(f"{FEED_CACHE_FILE}에 기록된 피드가 없습니다. main.py를 한 번 실행한 뒤 다시 시도하세요.")
+        return
+
+    print(f"피드 {len(rows)}개, 항목 {limit}개까지, 최선 {repeats}회 기준")
+    print(f"{'피드':<60} {'크기':>8} {'fast ms':>8} {'fp ms':>8} {'fast KB':>8} {'fp KB':>8}  일치")
+    totals = [0.0, 0.0, 0, 0]
+    for url, body in rows:
+        fast, fast_time, fast_peak = measure(lambda: list(islice(iter_feed_entries(body), limit)), repeats)
+        slow, slow_time, slow_peak = measure(lambda: feedparser.parse(body).entries[:limit], repeats)
+        same = [(e.get("title"), e.get("link")) for e in fast] == [(e.get("title"), e.get("link")) for e in slow]
+
+        totals[0] += fast_time; totals[1] += slow_time
+        totals[2] = max(totals[2], fast_peak); totals[3] = max(totals[3], slow_peak)
+        print(f"{url[:60]:<60} {len(body) // 1024:>6}KB {fast_time * 1000:>8.1f} {slow_time * 1000:>8.1f} "
+              f"{fast_peak // 1024:>8} {slow_peak // 1024:>8}  {'O' if same else 'X'}")
+
+    print(f"{'합계 / 최대 메모리':<60} {'':>8} {totals[0] * 1000:>8.1f} {totals[1] * 1000:>8.1f} "
+          f"{totals[2] // 1024:>8} {totals[3] // 1024:>8}")
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,28 @@
 import json
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import feedparser
 import re
 import sqlite3
 from typing import List, Dict
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import time
+import hashlib
+import math
+import random
+import threading
+import queue
+import unicodedata
+import struct
+import gzip
+import inspect
+from array import array
+from itertools import islice
+import xml.etree.ElementTree as ET
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 try:
     import google.generativeai as genai
@@ -15,11 +31,18 @@ except ImportError:
     HAS_GENAI = False
     print("google-generativeai 라이브러리가 없습니다.")
 
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
 NASA_API_KEY = os.environ.get('NASA_API_KEY')
 SPRINGER_API_KEY = os.environ.get("SPRINGER_API_KEY")
 GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY") 
 
 MODEL_NAME = 'gemini-2.5-flash-lite' 
+PROMPT_VERSION = 1
 
 classify_model = None
 
@@ -37,7 +60,23 @@ def clean_html(raw_html):
     return cleantext.strip()
 
 SCIENCE_FIELDS = ["천문·우주", "인지·신경", "물리학", "생명과학", "기타"]
+FIELD_SLUGS = {"천문·우주": "astro", "인지·신경": "neuro", "물리학": "physics", "생명과학": "life", "기타": "etc"}
 DB_FILE = "science_data.db"
+FEED_CACHE_FILE = "feed_cache.db"
+DATA_DIR = "data"
+SHARD_MANIFEST = f"{DATA_DIR}/manifest.json"
+BUILD_MANIFEST = "build_manifest.json"
+BRAIN_SOURCE = "brain.json"
+BRAIN_LOD_CELL_SIZES = [7.0, 4.0]
+BRAIN_LOD_ASSETS = [f"brain.lod{level}.bin" for level in range(len(BRAIN_LOD_CELL_SIZES) + 1)]
+
+FETCH_MAX_WORKERS = 8
+FETCH_TIMEOUT = 20
+FETCH_CONNECT_TIMEOUT = 5
+FETCH_READ_TIMEOUT = 15
+FETCH_DEADLINE_GRACE = 2
+FETCH_CHUNK_SIZE = 65536
+HTTP_POOL_HOSTS = 32
 
 RSS_SOURCES = [
     {"url": "https://www.nature.com/nature.rss", "fixed_category": None},
@@ -66,53 +105,412 @@ REVIEW_SOURCES = [
      {"name": "Annual Review of Neuroscience", "url": "https://www.annualreviews.org/rss/content/journals/neuro/latestarticles?fmt=rss", "field": "인지·신경"}
 ]
 
-def call_gemini_with_retry(model, prompt, api_key, retries=2):
+GEMINI_MAX_WORKERS = 4
+GEMINI_RPM = 15
+GEMINI_TPM = 250000
+GEMINI_MAX_ATTEMPTS = 5
+GEMINI_MAX_REQUEUES = 2
+GEMINI_BACKOFF_CAP = 60
+
+class RateLimiter:
+    # 분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 지키는 토큰 버킷. 여러 스레드가 공유합니다.
+    def __init__(self, rpm, tpm):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests = float(rpm)
+        self.tokens = float(tpm)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        self.updated = now
+        self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60)
+        self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60)
+
+    def acquire(self, tokens):
+        tokens = min(tokens, self.tpm)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.requests >= 1 and self.tokens >= tokens:
+                    self.requests -= 1
+                    self.tokens -= tokens
+                    return
+                wait_for = max(self.blocked_until - now,
+                               (1 - self.requests) * 60 / self.rpm,
+                               (tokens - self.tokens) * 60 / self.tpm,
+                               0.05)
+            time.sleep(wait_for)
+
+    def pause(self, seconds):
+        # 서버가 알려준 대기 시간(retry-after) 동안 모든 워커의 요청을 멈춥니다.
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+gemini_limiter = RateLimiter(GEMINI_RPM, GEMINI_TPM)
+
+def estimate_tokens(text):
+    return len(text) // 3 + 1
+
+def retry_after_hint(error):
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    if headers.get('Retry-After'):
+        try:
+            return float(headers['Retry-After'])
+        except ValueError:
+            pass
+    error_msg = str(error)
+    match = re.search(r'retry_delay\s*\{\s*seconds:\s*(\d+)', error_msg) or re.search(r'retry in ([\d.]+)\s*s', error_msg, re.IGNORECASE)
+    return float(match.group(1)) if match else None
+
+def is_retryable(error_msg):
+    error_msg = error_msg.lower()
+    return any(k in error_msg for k in ("429", "quota", "resource exhausted", "500", "503", "unavailable", "deadline", "timeout"))
+
+def call_gemini_with_retry(model, prompt, api_key, retries=GEMINI_MAX_ATTEMPTS, limiter=None, expected_output_tokens=0, stream=False):
     if not api_key or not model:
         return None
     genai.configure(api_key=api_key)
     for attempt in range(retries):
+        if limiter:
+            limiter.acquire(estimate_tokens(prompt) + expected_output_tokens)
         try:
-            return model.generate_content(prompt)
+            return model.generate_content(prompt, stream=stream)
         except Exception as e:
             error_msg = str(e)
-            if "429" in error_msg or "quota" in error_msg.lower():
-                time.sleep(5) 
-            else:
+            if not is_retryable(error_msg) or attempt == retries - 1:
+                print(f"Gemini 호출 실패: {error_msg[:200]}")
                 return None
+            delay = random.uniform(0, min(GEMINI_BACKOFF_CAP, 2 ** (attempt + 1)))
+            hint = retry_after_hint(e)
+            if hint is not None:
+                delay = max(delay, hint)
+                if limiter:
+                    limiter.pause(hint)
+            time.sleep(delay)
     return None
 
+def to_epoch(date_str):
+    # RFC-822(RSS)와 ISO 8601(Atom/Springer) 날짜 문자열을 UTC epoch 초로 변환합니다. 해석 불가 시 0
+    if not date_str:
+        return 0
+    date_str = date_str.strip()
+    try:
+        dt = parsedate_to_datetime(date_str)
+    except (TypeError, ValueError, IndexError):
+        try:
+            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        except ValueError:
+            return 0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+def migrate_pub_epoch(conn):
+    for table, key in (('videos', 'id'), ('articles', 'link')):
+        cols = [r[1] for r in conn.execute(f"PRAGMA table_info({table})")]
+        if 'pub_epoch' not in cols:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN pub_epoch INTEGER")
+
+        rows = conn.execute(f"SELECT {key}, pub_date FROM {table} WHERE pub_epoch IS NULL").fetchall()
+        if rows:
+            conn.executemany(f"UPDATE {table} SET pub_epoch = ? WHERE {key} = ?",
+                             [(to_epoch(pub_date), k) for k, pub_date in rows])
+            print(f"{table}: {len(rows)}개 행의 pub_epoch를 채웠습니다.")
+
+def migrate_translation_cache(conn):
+    cols = [r[1] for r in conn.execute("PRAGMA table_info(translation_cache)")]
+    if 'fixed_category' not in cols:
+        conn.execute("ALTER TABLE translation_cache ADD COLUMN fixed_category TEXT")
+
+def migrate_story_signatures(conn):
+    # 밴드 구성이나 SimHash 특징이 바뀌었거나 비교에 필요한 열이 없는 옛 서명은 버리고 새로 쌓습니다.
+    cols = [r[1] for r in conn.execute("PRAGMA table_info(story_signatures)")]
+    if cols and not {"source", "pub_epoch", "numbers", f"band{SIMHASH_BANDS - 1}"} <= set(cols):
+        conn.execute("DROP TABLE story_signatures")
+        print("story_signatures: 서명 형식이 바뀌어 기존 서명을 지웠습니다.")
+
+def connect_db():
+    conn = sqlite3.connect(DB_FILE, timeout=30)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
 def init_db():
     conn = sqlite3.connect(DB_FILE)
     c = conn.cursor()
 
+    c.execute("PRAGMA journal_mode=WAL")
+
     c.execute('''CREATE TABLE IF NOT EXISTS videos (
                     id TEXT PRIMARY KEY, title TEXT, link TEXT, thumbnail TEXT, 
-                    pub_date TEXT, category TEXT, source TEXT)''')
+                    pub_date TEXT, category TEXT, source TEXT, pub_epoch INTEGER)''')
 
     c.execute('''CREATE TABLE IF NOT EXISTS articles (
                     link TEXT PRIMARY KEY, title TEXT, pub_date TEXT, 
-                    category TEXT, source TEXT, type TEXT)''')
+                    category TEXT, source TEXT, type TEXT, pub_epoch INTEGER)''')
+
+    c.execute('''CREATE TABLE IF NOT EXISTS translation_cache (
+                    key TEXT PRIMARY KEY, title TEXT, tags TEXT, trans TEXT,
+                    model TEXT, prompt_version INTEGER, created_at TEXT, fixed_category TEXT)''')
+
+    migrate_story_signatures(conn)
+    band_columns = ", ".join(f"band{band} INTEGER" for band in range(SIMHASH_BANDS))
+    c.execute(f'''CREATE TABLE IF NOT EXISTS story_signatures (
+                    item_key TEXT PRIMARY KEY, item_type TEXT, canonical_url TEXT, simhash INTEGER,
+                    source TEXT, pub_epoch INTEGER, numbers TEXT, {band_columns})''')
+
+    migrate_pub_epoch(conn)
+    migrate_translation_cache(conn)
+
+    c.execute("CREATE INDEX IF NOT EXISTS idx_articles_category_type_epoch ON articles (category, type, pub_epoch DESC)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_videos_category_epoch ON videos (category, pub_epoch DESC)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_story_signatures_url ON story_signatures (canonical_url)")
+    for band in range(SIMHASH_BANDS):
+        c.execute(f"CREATE INDEX IF NOT EXISTS idx_story_signatures_band{band} ON story_signatures (band{band})")
     conn.commit()
     conn.close()
 
-def get_latest_videos(category=None, limit=8):
-    conn = sqlite3.connect(DB_FILE)
+def init_feed_cache():
+    conn = sqlite3.connect(FEED_CACHE_FILE)
+    c = conn.cursor()
+
+    c.execute('''CREATE TABLE IF NOT EXISTS feed_cache (
+                    url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT,
+                    body BLOB, fetched_at TEXT)''')
+    conn.commit()
+    conn.close()
+
+def create_http_session():
+    # 모든 수집기가 함께 쓰는 세션입니다. 호스트별 연결 풀(keep-alive)을 재사용해 같은 호스트에는
+    # TCP/TLS 핸드셰이크를 한 번만 치르고, gzip/deflate(및 설치돼 있으면 br) 응답은 자동으로 풀립니다.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=FETCH_MAX_WORKERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+http_session = create_http_session()
+
+# run_fetch_jobs가 작업 스레드마다 마감 시각을 걸어 둡니다. http_get과 read_body는 남은 시간 안에서만 기다립니다.
+fetch_deadline = threading.local()
+
+def fetch_time_left():
+    deadline = getattr(fetch_deadline, "at", None)
+    return None if deadline is None else deadline - time.monotonic()
+
+def http_get(url, **kwargs):
+    connect, read = FETCH_CONNECT_TIMEOUT, FETCH_READ_TIMEOUT
+    left = fetch_time_left()
+    if left is not None:
+        if left <= 0:
+            raise TimeoutError(f"수집 마감 시각 초과: {url}")
+        connect, read = min(connect, left), min(read, left)
+    kwargs.setdefault("timeout", (connect, read))
+    return http_session.get(url, **kwargs)
+
+def read_body(response):
+    # 본문을 도착하는 대로(read1) 읽으며 조각마다 마감 시각을 확인합니다. 데이터가 찔끔찔끔 와도 마감을 넘기지 않고,
+    # 완전히 멈춘 연결은 http_get이 남은 시간으로 묶어 둔 읽기 타임아웃에 걸립니다.
+    chunks = []
+    while True:
+        chunk = response.raw.read1(FETCH_CHUNK_SIZE, decode_content=True)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        left = fetch_time_left()
+        if left is not None and left <= 0:
+            response.close()
+            raise TimeoutError(f"수집 마감 시각 초과: {response.url}")
+    return b"".join(chunks)
+
+def fetch_feed(url):
+    # 조건부 요청(ETag/Last-Modified)으로 피드를 가져옵니다. 변경이 없으면 None을 반환해 파싱 자체를 건너뜁니다.
+    # 새 검증자와 본문은 여기서 기록하지 않고 feed.cache_entry로 돌려줍니다. 이 피드의 항목이 모두 DB에 들어간 뒤에
+    # collect_and_process_data가 save_feed_cache로 기록하므로, 이번에 저장하지 못한 항목은 다음 실행에서 다시 받습니다.
+    conn = sqlite3.connect(FEED_CACHE_FILE, timeout=30)
+    try:
+        row = conn.execute("SELECT etag, last_modified, body FROM feed_cache WHERE url = ?", (url,)).fetchone()
+
+        headers = {"User-Agent": feedparser.USER_AGENT}
+        if row and row[0]: headers["If-None-Match"] = row[0]
+        if row and row[1]: headers["If-Modified-Since"] = row[1]
+
+        response = http_get(url, headers=headers, stream=True)
+        now = datetime.now().isoformat(timespec='seconds')
+
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+
+        body = read_body(response)
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        if row is not None and row[2] == body:
+            # 기록된 본문은 항목이 모두 저장된 뒤에만 쓰이므로, 내용이 같으면 새 검증자를 바로 기록해도 됩니다.
+            # 같은 내용에 새 ETag/Last-Modified를 주는 서버도 다음 실행부터 304로 답할 수 있게 합니다.
+            if (etag, last_modified) != (row[0], row[1]):
+                with conn:
+                    conn.execute("UPDATE feed_cache SET etag = ?, last_modified = ?, fetched_at = ? WHERE url = ?",
+                                 (etag, last_modified, now, url))
+            return None
+        cache_entry = (url, etag, last_modified, body, now)
+        return feedparser.FeedParserDict(entries=iter_feed_entries(body), cache_entry=cache_entry)
+    finally:
+        conn.close()
+
+def save_feed_cache(items, unresolved):
+    # 항목이 하나라도 저장되지 못한 피드는 검증자를 기록하지 않아 다음 실행에서 같은 본문을 다시 받게 합니다.
+    entries = {it["feed_cache"][0]: it["feed_cache"] for it in items if it.get("feed_cache")}
+    blocked = {it["feed_cache"][0] for it in unresolved if it.get("feed_cache")}
+    rows = [entry for url, entry in entries.items() if url not in blocked]
+    if rows:
+        conn = sqlite3.connect(FEED_CACHE_FILE, timeout=30)
+        with conn:
+            conn.executemany("""INSERT OR REPLACE INTO feed_cache (url, etag, last_modified, body, fetched_at)
+                                VALUES (?,?,?,?,?)""", rows)
+        conn.close()
+    if blocked:
+        print(f"피드 {len(blocked)}개는 저장하지 못한 항목이 있어 다음 실행에서 다시 받습니다.")
+
+FEED_CHUNK_SIZE = 16384
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+RSS1_NS = "{http://purl.org/rss/1.0/}"
+RDF_NS = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+DCTERMS_NS = "{http://purl.org/dc/terms/}"
+YT_NS = "{http://www.youtube.com/xml/schemas/2015}"
+MEDIA_NS = "{http://search.yahoo.com/mrss/}"
+
+FEED_ROOT_TAGS = {"rss", f"{RDF_NS}RDF", f"{ATOM_NS}feed"}
+FEED_ITEM_TAGS = {"item", f"{RSS1_NS}item", f"{ATOM_NS}entry"}
+# 항목의 텍스트 자식 요소 -> feedparser 엔트리 키
+FEED_TEXT_FIELDS = {
+    "title": "title", f"{RSS1_NS}title": "title", f"{ATOM_NS}title": "title",
+    "link": "link", f"{RSS1_NS}link": "link",
+    "description": "summary", f"{RSS1_NS}description": "summary", f"{ATOM_NS}summary": "summary",
+    "pubDate": "published", f"{ATOM_NS}published": "published", f"{DCTERMS_NS}issued": "published",
+    f"{ATOM_NS}updated": "updated", f"{DC_NS}date": "updated", f"{DCTERMS_NS}modified": "updated",
+    "author": "author", f"{DC_NS}creator": "author",
+    "guid": "id", f"{ATOM_NS}id": "id",
+    f"{DC_NS}type": "dc_type",
+    f"{YT_NS}videoId": "yt_videoid",
+}
+
+def feed_entry_from_element(elem):
+    # 수집기가 쓰는 필드만 feedparser와 같은 키로 채웁니다(HTML 정리는 하지 않습니다).
+    entry = feedparser.FeedParserDict()
+    tags = []
+    for child in elem:
+        tag = child.tag
+        text = (child.text or "").strip()
+        key = FEED_TEXT_FIELDS.get(tag)
+        if key:
+            entry.setdefault(key, text)
+            if tag == "guid" and child.get("isPermaLink", "true") != "false":
+                entry.setdefault("guidislink", True)
+        elif tag == f"{ATOM_NS}link":
+            if child.get("rel", "alternate") == "alternate" and child.get("href"):
+                entry.setdefault("link", child.get("href"))
+        elif tag == f"{ATOM_NS}author":
+            name = child.findtext(f"{ATOM_NS}name")
+            if name: entry.setdefault("author", name.strip())
+        elif tag == "category" or tag == f"{DC_NS}subject":
+            tags.append(feedparser.FeedParserDict(term=text, scheme=child.get("domain"), label=None))
+        elif tag == f"{ATOM_NS}category":
+            tags.append(feedparser.FeedParserDict(term=child.get("term"), scheme=child.get("scheme"), label=child.get("label")))
+        elif tag == f"{MEDIA_NS}group":
+            description = child.findtext(f"{MEDIA_NS}description")
+            if description: entry.setdefault("summary", description.strip())
+    if tags:
+        entry["tags"] = tags
+    if elem.get(f"{RDF_NS}about"):
+        entry.setdefault("id", elem.get(f"{RDF_NS}about"))
+    if "link" not in entry and entry.pop("guidislink", False):
+        entry["link"] = entry["id"]
+    entry.pop("guidislink", None)
+    return entry
+
+def iter_fast_feed_entries(body):
+    # RSS 2.0 / RSS 1.0(RDF) / Atom(YouTube 포함)을 조각 단위로 흘려 넣으며 항목이 끝날 때마다 내보냅니다.
+    # 호출하는 쪽이 필요한 개수를 채우고 멈추면 나머지 문서는 파싱하지 않습니다.
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root_checked = False
+    for offset in range(0, len(body), FEED_CHUNK_SIZE):
+        parser.feed(body[offset:offset + FEED_CHUNK_SIZE])
+        for event, elem in parser.read_events():
+            if not root_checked:
+                if elem.tag not in FEED_ROOT_TAGS:
+                    raise ValueError(f"지원하지 않는 피드 형식: {elem.tag}")
+                root_checked = True
+            if event == "end" and elem.tag in FEED_ITEM_TAGS:
+                yield feed_entry_from_element(elem)
+                elem.clear()
+    parser.close()
+
+def iter_feed_entries(body):
+    # 빠른 경로가 처리하지 못하는 문서(잘못된 XML, HTML 엔티티, 다른 형식)는 feedparser로 넘기고,
+    # 이미 내보낸 항목은 건너뜁니다.
+    yielded = 0
+    try:
+        for entry in iter_fast_feed_entries(body):
+            yield entry
+            yielded += 1
+        return
+    except (ET.ParseError, ValueError):
+        pass
+    yield from feedparser.parse(body).entries[yielded:]
+
+ARTICLE_TYPE_KEYS = {"news": "news", "paper": "papers", "Reviews Paper": "reviews"}
+
+def get_latest_videos(category=None, limit=8, conn=None):
+    own_conn = conn is None
+    if own_conn:
+        conn = connect_db()
     c = conn.cursor()
     
     if category:
-        query = "SELECT title, link, thumbnail, pub_date, source FROM videos WHERE category LIKE ? ORDER BY pub_date DESC LIMIT ?"
-        c.execute(query, (f'%{category}%', limit))
+        query = "SELECT title, link, thumbnail, pub_date, source FROM videos WHERE category = ? ORDER BY pub_epoch DESC LIMIT ?"
+        c.execute(query, (category, limit))
     else:
-        c.execute("SELECT title, link, thumbnail, pub_date, source FROM videos ORDER BY pub_date DESC LIMIT ?", (limit,))
+        c.execute("SELECT title, link, thumbnail, pub_date, source FROM videos ORDER BY pub_epoch DESC LIMIT ?", (limit,))
         
     rows = c.fetchall()
-    conn.close()
+    if own_conn:
+        conn.close()
     return [{"title": r[0], "link": r[1], "thumbnail": r[2], "date": r[3], "source": r[4]} for r in rows]
 
+def get_latest_by_field(conn, fields=SCIENCE_FIELDS, limit=10, video_limit=5):
+    # 분야 x 종류별 최신 N개를 윈도 함수 한 번의 쿼리로 가져옵니다.
+    placeholders = ",".join("?" * len(fields))
+    type_placeholders = ",".join("?" * len(ARTICLE_TYPE_KEYS))
+    query = f"""
+        SELECT category, kind, title, link, source, pub_date, thumbnail FROM (
+            SELECT category, type AS kind, title, link, source, pub_date, NULL AS thumbnail,
+                   ROW_NUMBER() OVER (PARTITION BY category, type ORDER BY pub_epoch DESC) AS rn
+            FROM articles WHERE category IN ({placeholders}) AND type IN ({type_placeholders})
+            UNION ALL
+            SELECT category, 'video' AS kind, title, link, source, pub_date, thumbnail,
+                   ROW_NUMBER() OVER (PARTITION BY category ORDER BY pub_epoch DESC) AS rn
+            FROM videos WHERE category IN ({placeholders})
+        )
+        WHERE rn <= CASE kind WHEN 'video' THEN ? ELSE ? END
+        ORDER BY category, kind, rn"""
+    params = list(fields) + list(ARTICLE_TYPE_KEYS) + list(fields) + [video_limit, limit]
+
+    latest = {field: {"news": [], "videos": [], "papers": [], "reviews": []} for field in fields}
+    for category, kind, title, link, source, pub_date, thumbnail in conn.execute(query, params):
+        if kind == 'video':
+            latest[category]["videos"].append({"title": title, "link": link, "thumbnail": thumbnail, "date": pub_date, "source": source})
+        else:
+            latest[category][ARTICLE_TYPE_KEYS[kind]].append({"title": title, "link": link, "source": source, "date": pub_date})
+    return latest
+
 def get_nasa_data():
     url = f"https://api.nasa.gov/planetary/apod?api_key={NASA_API_KEY}"
     try:
-        response = requests.get(url, timeout=10)
+        response = http_get(url)
         if response.status_code == 200:
             data = response.json()
             return data
@@ -120,208 +518,733 @@ def get_nasa_data():
         pass
     return None
 
-def classify_and_save_to_db(items: List[Dict], item_type: str):
-    if not items: return
-    
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
-    
-    to_process = []
+DEDUP_CHUNK_SIZE = 500
+
+VIDEO_UPSERT = """
+    INSERT INTO videos (id, title, link, thumbnail, pub_date, category, source, pub_epoch)
+    VALUES (?,?,?,?,?,?,?,?)
+    ON CONFLICT(id) DO UPDATE SET
+        title = excluded.title, link = excluded.link, thumbnail = excluded.thumbnail,
+        pub_date = excluded.pub_date, category = excluded.category, source = excluded.source,
+        pub_epoch = excluded.pub_epoch
+    WHERE (videos.title, videos.link, videos.thumbnail, videos.pub_date, videos.category, videos.source, videos.pub_epoch)
+          IS NOT (excluded.title, excluded.link, excluded.thumbnail, excluded.pub_date, excluded.category, excluded.source, excluded.pub_epoch)
+"""
+
+ARTICLE_UPSERT = """
+    INSERT INTO articles (link, title, pub_date, category, source, type, pub_epoch)
+    VALUES (?,?,?,?,?,?,?)
+    ON CONFLICT(link) DO UPDATE SET
+        title = excluded.title, pub_date = excluded.pub_date, category = excluded.category,
+        source = excluded.source, type = excluded.type, pub_epoch = excluded.pub_epoch
+    WHERE (articles.title, articles.pub_date, articles.category, articles.source, articles.type, articles.pub_epoch)
+          IS NOT (excluded.title, excluded.pub_date, excluded.category, excluded.source, excluded.type, excluded.pub_epoch)
+"""
+
+def build_row(item, item_type, translated_title, category):
+    if item_type == 'video':
+        return (item['id'], translated_title, item['link'], item['thumbnail'], item['date'], category, item['source'], to_epoch(item['date']))
+    return (item['link'], translated_title, item['date'], category, item['source'], item_type, to_epoch(item['date']))
+
+def save_rows(conn, item_type, rows):
+    # 트랜잭션 안에서 executemany로 한 번에 기록합니다. 커밋은 호출한 쪽(실행 단위)에서 합니다.
+    if not rows: return
+    conn.executemany(VIDEO_UPSERT if item_type == 'video' else ARTICLE_UPSERT, rows)
+    print(f"{item_type}: {len(rows)}개 항목 저장")
+
+def select_in_chunks(conn, query, keys):
+    # query의 {placeholders} 자리에 청크 단위 IN (...) 목록을 넣어 실행합니다.
+    keys = [k for k in keys if k is not None]
+    for i in range(0, len(keys), DEDUP_CHUNK_SIZE):
+        chunk = keys[i:i+DEDUP_CHUNK_SIZE]
+        yield from conn.execute(query.format(placeholders=",".join("?" * len(chunk))), chunk)
+
+def find_existing_keys(conn, table, col, keys) -> set:
+    # 키 목록을 청크 단위 IN (...) 조회로 확인해 이미 저장된 키 집합을 돌려줍니다.
+    return {r[0] for r in select_in_chunks(conn, f"SELECT {col} FROM {table} WHERE {col} IN ({{placeholders}})", keys)}
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 8
+SIMHASH_MAX_DISTANCE = 7
+SIMHASH_WINDOW = 3 * 86400
+SIMHASH_BAND_COLUMNS = ", ".join(f"band{band}" for band in range(SIMHASH_BANDS))
+TITLE_STOPWORDS = {"a", "an", "the", "of", "in", "on", "at", "to", "for", "from", "by", "with", "and",
+                   "is", "are", "as", "its", "it", "that", "this", "be", "was", "after", "before", "into", "than", "s"}
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "mc_cid", "mc_eid", "cmpid", "ref", "rss", "src"}
+
+STORY_SIGNATURE_MATCH = f"""
+    SELECT canonical_url, simhash, source, pub_epoch, numbers FROM story_signatures
+    WHERE item_type = ? AND (canonical_url = ?
+          OR (pub_epoch BETWEEN ? AND ? AND ({" OR ".join(f"band{band} = ?" for band in range(SIMHASH_BANDS))})))"""
+
+def canonical_url(url):
+    # 추적 파라미터와 조각을 떼고 호스트(www./m.)와 스킴을 통일합니다. 유튜브는 영상 ID(v)만 남깁니다.
+    parts = urlsplit((url or "").strip())
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    path = parts.path.rstrip("/") or "/"
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS]
+    if host == "youtu.be":
+        host, path, query = "youtube.com", "/watch", [("v", path.strip("/"))]
+    elif host == "youtube.com" and path == "/watch":
+        query = [(k, v) for k, v in query if k == "v"]
+    return urlunsplit(("https", host, path, urlencode(sorted(query)), ""))
+
+def title_shingles(title):
+    # 불용어를 뺀 단어마다 앞뒤에 공백을 붙여 자른 문자 3-gram. 단어 경계를 넘는 조각을 만들지 않아
+    # 관사 추가("the atmosphere of a ...")나 어순 변화, 철자 변형(vapor/vapour)에도 대부분의 조각이 그대로 남습니다.
+    words = normalize_title(title).split()
+    shingles = set()
+    for word in [w for w in words if w not in TITLE_STOPWORDS] or words:
+        padded = f" {word} "
+        shingles.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return shingles or {""}
+
+def title_simhash(title):
+    # 제목 조각으로 만든 64비트 SimHash. DB에 저장하므로 프로세스와 무관한 blake2b를 씁니다.
+    weights = [0] * SIMHASH_BITS
+    for shingle in title_shingles(title):
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit in range(SIMHASH_BITS) if weights[bit] > 0)
+
+def simhash_bands(simhash):
+    # 8비트 x 8 밴드: 해밍 거리가 7 이하이면 적어도 한 밴드는 정확히 같습니다(비둘기집 원리).
+    width = SIMHASH_BITS // SIMHASH_BANDS
+    return [(simhash >> (band * width)) & ((1 << width) - 1) for band in range(SIMHASH_BANDS)]
+
+def to_signed64(value):
+    # SQLite INTEGER는 부호 있는 64비트이므로 상위 비트가 켜진 해시는 음수로 저장합니다.
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+def is_near_duplicate(simhash, other):
+    return bin((simhash ^ other) & ((1 << SIMHASH_BITS) - 1)).count("1") <= SIMHASH_MAX_DISTANCE
+
+def title_numbers(title):
+    # 제목의 숫자 묶음(천 단위 쉼표 제거). "Starlink 23기"와 "24기"처럼 숫자만 다른 정기 기사는 다른 기사입니다.
+    digits = re.findall(r"\d+", re.sub(r"(?<=\d),(?=\d{3}\b)", "", unicodedata.normalize("NFKC", title or "")))
+    return " ".join(sorted(set(digits)))
+
+def story_signature(item):
+    # (정규화 URL, SimHash, 밴드, 출처, 발행 시각, 제목 숫자). 날짜를 해석할 수 없으면 지금 시각을 씁니다.
+    url = canonical_url(item.get('link'))
+    simhash = title_simhash(item['title'])
+    return (url, simhash, simhash_bands(simhash), item.get('source'),
+            to_epoch(item.get('date')) or int(time.time()), title_numbers(item['title']))
+
+def is_same_story(signature, other):
+    # SimHash만으로 합치려면 다른 매체(호스트나 출처가 다름)의 기사이고, 발행 시각이 SIMHASH_WINDOW 안이며,
+    # 제목의 숫자가 모두 같아야 합니다. 같은 매체의 정기 기사(발사 소식, 주간 팟캐스트)는 합치지 않습니다.
+    url, simhash, _, source, epoch, numbers = signature
+    other_url, other_simhash, _, other_source, other_epoch, other_numbers = other
+    return ((urlsplit(url).hostname != urlsplit(other_url).hostname or source != other_source)
+            and abs(epoch - other_epoch) <= SIMHASH_WINDOW
+            and numbers == other_numbers
+            and is_near_duplicate(simhash, other_simhash))
+
+def collapse_near_duplicates(conn, item_type, items, col):
+    # 같은 기사(정규화 URL 일치, 또는 다른 매체의 비슷한 시기 기사 중 숫자가 같고 제목 SimHash 해밍 거리 7 이하)는
+    # 처음 것 하나만 남깁니다. 이미 저장된 기사는 story_signatures의 밴드 인덱스로, 이번 묶음 안의 중복은 메모리에서 찾습니다.
+    kept, signatures, duplicates = [], {}, {}
+    seen_urls = {}
+    seen_bands = [{} for _ in range(SIMHASH_BANDS)]
     for it in items:
-        uid = it.get('id') if item_type == 'video' else it.get('link')
-        table = 'videos' if item_type == 'video' else 'articles'
-        col = 'id' if item_type == 'video' else 'link'
-        
-        c.execute(f"SELECT 1 FROM {table} WHERE {col} = ?", (uid,))
-        if c.fetchone(): continue
-        
-        to_process.append(it)
-            
-    conn.commit()
-    conn.close()
+        signature = story_signature(it)
+        url, _, bands, _, epoch, _ = signature
 
-    if not to_process or not GOOGLE_API_KEY: return
-    
-    batch_size = 100
-    for i in range(0, len(to_process), batch_size):
-        batch = to_process[i:i+batch_size]
-        
-        lines = []
-        for idx, it in enumerate(batch):
-            fixed = f" (Fixed Category: {it['fixed_category']})" if it.get('fixed_category') else ""
-            lines.append(f"ID:{idx} | Title:{it['title']}{fixed}")
-        
-        context = "\n".join(lines)
-        
-        prompt = f"""
-        You are a highly precise Science Translator specialized in academic journals (Nature, Science, Cell). 
-        Your absolute priority is **Scientific Integrity** and **Zero Distortion**.
+        # duplicates: 버린 항목 키 -> 대표 항목 키(이미 저장된 기사와 겹치면 None)
+        if url in seen_urls:
+            duplicates[it.get(col)] = seen_urls[url]
+            continue
+        stored = conn.execute(STORY_SIGNATURE_MATCH,
+                              (item_type, url, epoch - SIMHASH_WINDOW, epoch + SIMHASH_WINDOW, *bands)).fetchall()
+        if any(stored_url == url or is_same_story(signature, (stored_url, other & ((1 << SIMHASH_BITS) - 1), None, source, other_epoch, numbers))
+               for stored_url, other, source, other_epoch, numbers in stored):
+            duplicates[it.get(col)] = None
+            continue
+        match = next((key for band, value in enumerate(bands) for key in seen_bands[band].get(value, ())
+                      if is_same_story(signature, signatures[key])), None)
+        if match is not None:
+            duplicates[it.get(col)] = match
+            continue
 
-        Analyze the given titles and perform two tasks:
+        kept.append(it)
+        signatures[it.get(col)] = signature
+        seen_urls[url] = it.get(col)
+        for band, value in enumerate(bands):
+            seen_bands[band].setdefault(value, []).append(it.get(col))
+    return kept, signatures, duplicates
+
+def find_unresolved(conn, table, col, items, duplicates):
+    # 이번 실행에서 DB에 들어가지 못한 항목. 묶음 안에서 합쳐진 중복은 대표 항목이 저장됐는지로 판단합니다.
+    saved = find_existing_keys(conn, table, col, {it.get(col) for it in items} | set(duplicates.values()))
+    unresolved = []
+    for it in items:
+        key = it.get(col)
+        representative = duplicates[key] if key in duplicates else key
+        if representative is not None and representative not in saved:
+            unresolved.append(it)
+    return unresolved
+
+def save_story_signatures(conn, item_type, table, col, signatures):
+    # 실제로 저장된 항목의 서명만 기록합니다. 분류에 실패한 항목이 다음 실행에서 자기 서명에 막히지 않게 합니다.
+    saved = find_existing_keys(conn, table, col, signatures.keys())
+    conn.executemany(f"""INSERT OR IGNORE INTO story_signatures
+                         (item_key, item_type, canonical_url, simhash, source, pub_epoch, numbers, {SIMHASH_BAND_COLUMNS})
+                         VALUES (?,?,?,?,?,?,?,{",".join("?" * SIMHASH_BANDS)})""",
+                     [(key, item_type, url, to_signed64(simhash), source, epoch, numbers, *bands)
+                      for key, (url, simhash, bands, source, epoch, numbers) in signatures.items() if key in saved])
+
+def normalize_title(title):
+    title = unicodedata.normalize("NFKC", title or "").lower()
+    title = re.sub(r"[^\w\s]", " ", title)
+    return " ".join(title.split())
+
+def translation_cache_key(title, fixed_category=None):
+    # 고정 분야가 붙은 요청은 AI가 그 분야를 첫 태그로 강제로 고르므로, 같은 제목이라도 따로 캐시합니다.
+    raw = f"{MODEL_NAME}|{PROMPT_VERSION}|{normalize_title(title)}"
+    if fixed_category:
+        raw += f"|{fixed_category}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def load_cached_translations(conn, keys) -> Dict:
+    query = "SELECT key, tags, trans FROM translation_cache WHERE key IN ({placeholders})"
+    return {key: {"tags": json.loads(tags), "trans": trans} for key, tags, trans in select_in_chunks(conn, query, keys)}
+
+def save_cached_translations(conn, entries):
+    # entries: [(원문 제목, 고정 분야 또는 None, {"tags": [...], "trans": "..."})]
+    now = datetime.now().isoformat(timespec='seconds')
+    conn.executemany("""INSERT OR REPLACE INTO translation_cache (key, title, tags, trans, model, prompt_version, created_at, fixed_category)
+                        VALUES (?,?,?,?,?,?,?,?)""",
+                     [(translation_cache_key(title, fixed), title, json.dumps(res["tags"], ensure_ascii=False), res["trans"],
+                       MODEL_NAME, PROMPT_VERSION, now, fixed) for title, fixed, res in entries])
+
+def resolve_item(item, item_type, res):
+    ai_tags = res.get('tags') or ["기타"]
+    category = item.get('fixed_category') or ai_tags[0]
+    translated_title = res.get('trans', item['title'])
+    return build_row(item, item_type, translated_title, category)
+
+NB_HASH_BITS = 18
+NB_ALPHA = 1.0
+NB_MIN_DOCS = 500
+NB_MIN_CONFIDENCE = 0.999
+
+HANGUL_RE = re.compile("[가-힣]")
+
+# (rowid, 제목, 분야) 학습 데이터. 번역 캐시는 영어 원문 제목과 AI가 고른 첫 번째 분야를 줍니다.
+# 고정 분야가 강제된 캐시 행은 AI의 판단이 아니므로 학습에서 뺍니다.
+NB_TRAINING_QUERIES = {
+    "articles": "SELECT rowid, title, category FROM articles WHERE rowid > ? ORDER BY rowid",
+    "videos": "SELECT rowid, title, category FROM videos WHERE rowid > ? ORDER BY rowid",
+    "translation_cache": "SELECT rowid, title, json_extract(tags, '$[0]') FROM translation_cache WHERE rowid > ? AND fixed_category IS NULL ORDER BY rowid",
+}
+
+def needs_translation(title):
+    return not HANGUL_RE.search(title or "")
+
+def title_features(title):
+    # 단어와 단어의 앞 두 글자(한국어 조사가 붙은 변형을 묶어 줌)를 해시 버킷 번호로 바꿉니다.
+    # 모델은 프로세스 안에서만 쓰이므로 내장 hash()로 충분합니다.
+    words = normalize_title(title).split()
+    features = {hash(w) for w in words}
+    features.update(hash(("prefix", w[:2])) for w in words if len(w) > 2)
+    mask = (1 << NB_HASH_BITS) - 1
+    return [h & mask for h in features]
+
+class LocalClassifier:
+    # DB에 쌓인 분류 결과로 학습하는 해시 n-gram 나이브 베이즈 분류기.
+    # 테이블별 rowid 워터마크 이후의 새 행만 읽어 추가 학습합니다.
+    def __init__(self, fields=SCIENCE_FIELDS):
+        self.fields = list(fields)
+        self.index = {field: k for k, field in enumerate(self.fields)}
+        self.counts = [array('I', bytes(4 << NB_HASH_BITS)) for _ in self.fields]
+        self.totals = [0] * len(self.fields)
+        self.docs = [0] * len(self.fields)
+        self.watermarks = {table: 0 for table in NB_TRAINING_QUERIES}
+
+    def learn(self, title, category):
+        k = self.index.get(category)
+        if k is None or not title: return
+        features = title_features(title)
+        counts = self.counts[k]
+        for h in features:
+            counts[h] += 1
+        self.totals[k] += len(features)
+        self.docs[k] += 1
+
+    def update(self, conn):
+        learned = 0
+        for table, query in NB_TRAINING_QUERIES.items():
+            for rowid, title, category in conn.execute(query, (self.watermarks[table],)):
+                self.learn(title, category)
+                self.watermarks[table] = rowid
+                learned += 1
+        return learned
+
+    def classify(self, titles):
+        # [(분야, 사후확률)]. 학습 데이터가 부족하면 분야 없이 확신도 0을 돌려줍니다.
+        n = sum(self.docs)
+        if n < NB_MIN_DOCS:
+            return [(None, 0.0) for _ in titles]
+        priors = [math.log((d + 1) / (n + len(self.fields))) for d in self.docs]
+        norms = [math.log(total + NB_ALPHA * (1 << NB_HASH_BITS)) for total in self.totals]
+
+        results = []
+        for title in titles:
+            features = title_features(title)
+            scores = [priors[k] - norms[k] * len(features) + sum(math.log(counts[h] + NB_ALPHA) for h in features)
+                      for k, counts in enumerate(self.counts)]
+            best = max(range(len(scores)), key=scores.__getitem__)
+            confidence = 1 / sum(math.exp(score - scores[best]) for score in scores)
+            results.append((self.fields[best], confidence))
+        return results
+
+local_classifier = LocalClassifier()
+
+def classify_locally(pending, item_type):
+    # 번역이 필요 없는(한글) 제목 중 모든 항목에 고정 분야가 있거나 로컬 분류기가 충분히 확신하는 것은
+    # AI 없이 분류를 끝내고 pending에서 뺍니다. 제목은 원문을 그대로 씁니다.
+    keys = [key for key, group in pending.items() if not needs_translation(group[0]['title'])]
+    rows = []
+    for key, (category, confidence) in zip(keys, local_classifier.classify([pending[key][0]['title'] for key in keys])):
+        group = pending[key]
+        if confidence < NB_MIN_CONFIDENCE and not all(it.get('fixed_category') for it in group):
+            continue
+        res = {"tags": [category or "기타"], "trans": group[0]['title']}
+        rows.extend(resolve_item(it, item_type, res) for it in pending.pop(key))
+    return rows
 
-        1. [Classify]: Pick categories from: {', '.join(SCIENCE_FIELDS)}. 
-           - The FIRST category must be the most relevant.
-           - If a 'Fixed Category' is provided, you MUST use it as the FIRST category.
+def build_prompt(batch):
+    lines = []
+    for idx, it in enumerate(batch):
+        fixed = f" (Fixed Category: {it['fixed_category']})" if it.get('fixed_category') else ""
+        lines.append(f"ID:{idx} | Title:{it['title']}{fixed}")
 
-        2. [Translate]: Translate the title into professional Korean with 100% factual accuracy.
-           - **No Exaggeration**: Do not change the level of certainty. If the original uses 'may', 'suggests', or 'potential', translate them accurately (e.g., '~할 가능성', '~을 시사'). Never translate 'suggests' as 'proved'.
-           - **Technical Precision**: Use the exact Korean academic terms. Do not simplify terms if it leads to loss of nuance.
-           - **No Omission**: Every key scientific variable or subject mentioned in the original must be present in the translation.
-           - **Maintain Original Intent**: Follow the original author's logic and tone. Do not add 'clickbait' elements or sensationalize.
-           - **Keep Proper Nouns/Acronyms**: Keep globally recognized acronyms (NASA, CERN, CRISPR, JWST) and gene/protein names in their standard international forms.
+    context = "\n".join(lines)
 
-        Return ONLY a JSON array:
-        [{{"id": 0, "tags": ["Category1", "Category2"], "trans": "정밀하게 번역된 한국어 제목"}}]
+    prompt = f"""
+    You are a highly precise Science Translator specialized in academic journals (Nature, Science, Cell). 
+    Your absolute priority is **Scientific Integrity** and **Zero Distortion**.
 
-        [Titles]:
-        {context}
-        """
-        
-        response = call_gemini_with_retry(classify_model, prompt, GOOGLE_API_KEY)
-        if response:
-            try:
-                results = json.loads(re.search(r'\[.*\]', response.text, re.DOTALL).group())
-                res_map = {r['id']: r for r in results}
-                
-                conn = sqlite3.connect(DB_FILE)
-                curr = conn.cursor()
-                for idx, item in enumerate(batch):
-                    res = res_map.get(idx, {})
-                    
-                    ai_tags = res.get('tags', ["기타"])
-                    category = item.get('fixed_category') or (ai_tags[0] if ai_tags else "기타")
-                    
-                    translated_title = res.get('trans', item['title'])
-                    
-                    if item_type == 'video':
-                        curr.execute("INSERT OR REPLACE INTO videos VALUES (?,?,?,?,?,?,?)",
-                                   (item['id'], translated_title, item['link'], item['thumbnail'], item['date'], category, item['source']))
-                    else:
-                        curr.execute("INSERT OR REPLACE INTO articles VALUES (?,?,?,?,?,?)",
-                                   (item['link'], translated_title, item['date'], category, item['source'], item_type))
-                conn.commit()
-                conn.close()
-            except Exception as e: 
-                print(f"AI 응답 처리 중 에러 발생: {e}")
-
-def fetch_rss_news() -> List[Dict]:
-    all_news = []
-    print("RSS 뉴스 피드 읽는 중...")
-    for source_info in RSS_SOURCES:
+    Analyze the given titles and perform two tasks:
+
+    1. [Classify]: Pick categories from: {', '.join(SCIENCE_FIELDS)}. 
+       - The FIRST category must be the most relevant.
+       - If a 'Fixed Category' is provided, you MUST use it as the FIRST category.
+
+    2. [Translate]: Translate the title into professional Korean with 100% factual accuracy.
+       - **No Exaggeration**: Do not change the level of certainty. If the original uses 'may', 'suggests', or 'potential', translate them accurately (e.g., '~할 가능성', '~을 시사'). Never translate 'suggests' as 'proved'.
+       - **Technical Precision**: Use the exact Korean academic terms. Do not simplify terms if it leads to loss of nuance.
+       - **No Omission**: Every key scientific variable or subject mentioned in the original must be present in the translation.
+       - **Maintain Original Intent**: Follow the original author's logic and tone. Do not add 'clickbait' elements or sensationalize.
+       - **Keep Proper Nouns/Acronyms**: Keep globally recognized acronyms (NASA, CERN, CRISPR, JWST) and gene/protein names in their standard international forms.
+
+    Return ONLY a JSON array:
+    [{{"id": 0, "tags": ["Category1", "Category2"], "trans": "정밀하게 번역된 한국어 제목"}}]
+
+    [Titles]:
+    {context}
+    """
+    return prompt
+
+BATCH_MAX_ITEMS = 100
+BATCH_MAX_INPUT_TOKENS = 4000
+BATCH_MAX_OUTPUT_TOKENS = 6000
+
+def estimate_item_tokens(item):
+    # (입력, 출력) 토큰 추정치. 출력은 JSON 껍데기 + 한국어 번역(원문보다 토큰이 많음)
+    fixed = f" (Fixed Category: {item['fixed_category']})" if item.get('fixed_category') else ""
+    input_tokens = estimate_tokens(f"ID:000 | Title:{item['title']}{fixed}")
+    output_tokens = 25 + 2 * estimate_tokens(item['title'])
+    return input_tokens, output_tokens
+
+def pack_batches(groups):
+    # 고정 100개 대신 입력/출력 토큰 예산에 맞춰 배치를 채웁니다.
+    batches = []
+    current, current_in, current_out = [], 0, 0
+    for group in groups:
+        item_in, item_out = estimate_item_tokens(group[0])
+        if current and (current_in + item_in > BATCH_MAX_INPUT_TOKENS
+                        or current_out + item_out > BATCH_MAX_OUTPUT_TOKENS
+                        or len(current) >= BATCH_MAX_ITEMS):
+            batches.append(current)
+            current, current_in, current_out = [], 0, 0
+        current.append(group)
+        current_in += item_in
+        current_out += item_out
+    if current:
+        batches.append(current)
+    return batches
+
+def iter_json_array_items(chunks):
+    # 스트리밍 텍스트 조각에서 첫 번째 JSON 배열의 원소를 완성되는 즉시 하나씩 돌려줍니다.
+    # 깨진 원소는 None으로 건너뛰고 나머지는 살립니다.
+    started = False
+    depth = 0
+    in_string = escaped = False
+    buf = []
+    for chunk in chunks:
+        for ch in chunk:
+            if not started:
+                started = ch == '['
+                continue
+            if depth == 0:
+                if ch == ']':
+                    return
+                if ch in '{[':
+                    depth = 1
+                    buf = [ch]
+                continue
+
+            buf.append(ch)
+            if in_string:
+                if escaped: escaped = False
+                elif ch == '\\': escaped = True
+                elif ch == '"': in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in '{[':
+                depth += 1
+            elif ch in '}]':
+                depth -= 1
+                if depth == 0:
+                    try:
+                        yield json.loads("".join(buf))
+                    except ValueError:
+                        yield None
+
+def classify_batch(batch, emit):
+    # 워커 스레드에서 실행: 응답을 스트리밍으로 읽으며 완성된 원소마다 emit(결과)을 호출합니다.
+    # 반환값: "ok" / "call_failed" / "parse_failed"(살린 원소가 하나도 없음)
+    prompt = build_prompt(batch)
+    expected_output = sum(estimate_item_tokens(it)[1] for it in batch)
+    response = call_gemini_with_retry(classify_model, prompt, GOOGLE_API_KEY, limiter=gemini_limiter,
+                                      expected_output_tokens=expected_output, stream=True)
+    if not response:
+        return "call_failed"
+
+    parsed = broken = 0
+    try:
+        for element in iter_json_array_items(chunk.text for chunk in response):
+            if isinstance(element, dict):
+                parsed += 1
+                emit(element)
+            else:
+                broken += 1
+    except Exception as e:
+        print(f"AI 응답 스트림 중단 ({len(batch)}개 배치, {parsed}개 수신): {e}")
+    if broken:
+        print(f"AI 응답에서 깨진 원소 {broken}개를 건너뛰었습니다.")
+    return "ok" if parsed else "parse_failed"
+
+def save_classified(conn, item_type, group, res):
+    # 원소 하나가 완성될 때마다 바로 기록하고 커밋합니다(WAL + synchronous=NORMAL이라 커밋 비용이 작음).
+    conn.executemany(VIDEO_UPSERT if item_type == 'video' else ARTICLE_UPSERT,
+                     [resolve_item(item, item_type, res) for item in group])
+    save_cached_translations(conn, [(group[0]['title'], group[0].get('fixed_category'), {"tags": res.get('tags') or ["기타"], "trans": res['trans']})])
+    conn.commit()
+
+def classify_and_save_to_db(items: List[Dict], item_type: str, conn=None) -> List[Dict]:
+    # 반환값: 저장하지 못한 항목 목록(다음 실행에서 다시 시도할 것)
+    if not items: return []
+    
+    table, col = ('videos', 'id') if item_type == 'video' else ('articles', 'link')
+
+    own_conn = conn is None
+    if own_conn:
+        conn = connect_db()
+    existing = find_existing_keys(conn, table, col, {it.get(col) for it in items})
+
+    to_process = []
+    seen = set()
+    for it in items:
+        uid = it.get(col)
+        if uid in existing or uid in seen: continue
+        seen.add(uid)
+        to_process.append(it)
+
+    new_items = [it for it in items if it.get(col) not in existing]
+    to_process, signatures, duplicates = collapse_near_duplicates(conn, item_type, to_process, col)
+    if duplicates:
+        print(f"{item_type}: 중복 기사 {len(duplicates)}개를 합쳤습니다.")
+
+    # 정규화된 제목(+고정 분야) 기준 번역/분류 캐시: 적중하면 API 호출 없이 바로 저장하고, 같은 제목은 한 번만 요청합니다.
+    cached = load_cached_translations(conn, {translation_cache_key(it['title'], it.get('fixed_category')) for it in to_process})
+    rows = []
+    pending = {}
+    for it in to_process:
+        key = translation_cache_key(it['title'], it.get('fixed_category'))
+        if key in cached:
+            rows.append(resolve_item(it, item_type, cached[key]))
+        else:
+            pending.setdefault(key, []).append(it)
+    if cached:
+        print(f"{item_type}: 캐시 적중 {len(rows)}개, 요청 필요 {len(pending)}개")
+
+    local_classifier.update(conn)
+    local_rows = classify_locally(pending, item_type)
+    if local_rows:
+        print(f"{item_type}: 로컬 분류 {len(local_rows)}개, AI 요청 필요 {len(pending)}개")
+    rows += local_rows
+
+    if not pending or not GOOGLE_API_KEY:
+        if pending:
+            print(f"⚠️ {item_type}: GOOGLE_API_KEY가 없어 {sum(len(g) for g in pending.values())}개 항목을 분류하지 못했습니다. 다음 실행에서 다시 시도합니다.")
+        save_rows(conn, item_type, rows)
+        save_story_signatures(conn, item_type, table, col, signatures)
+        unresolved = find_unresolved(conn, table, col, new_items, duplicates)
+        if own_conn:
+            conn.commit()
+            conn.close()
+        return unresolved
+
+    groups = list(pending.values())
+    work = [(batch_groups, 0) for batch_groups in pack_batches(groups)]
+    print(f"{item_type}: {len(groups)}개 제목을 {len(work)}개 배치로 요청합니다.")
+
+    save_rows(conn, item_type, rows)
+
+    # 배치를 병렬로 요청하고, 워커가 스트림에서 꺼낸 원소를 메인 스레드가 받는 즉시 저장합니다.
+    # 아무것도 파싱하지 못한 배치는 반으로 나눠 다시 넣고, 호출 실패나 결과가 빠진 항목은
+    # GEMINI_MAX_REQUEUES번까지 다시 큐에 넣습니다.
+    saved = 0
+    dropped = []
+    events = queue.Queue()
+
+    def run(key, batch_groups):
+        status = "call_failed"
         try:
-            feed = feedparser.parse(source_info["url"])
-            if "nature.com" in source_info["url"]: source_name = "Nature"
-            elif "science.org" in source_info["url"]: source_name = "Science"
-            elif "sciencedaily" in source_info["url"]: source_name = "ScienceDaily"
-            elif "space.com" in source_info["url"]: source_name = "Space.com"
-            elif "phys.org" in source_info["url"]: source_name = "Phys.org"
-            elif "scientificamerican" in source_info["url"]: source_name = "Scientific American"
-            elif "quantamagazine" in source_info["url"]: source_name = "Quanta Magazine"
-            else: source_name = "Science News"
-            
-            collected_count = 0
-            for entry in feed.entries:
-                
-                if "nature.com" in source_info["url"] and "d41586" not in entry.link:
+            status = classify_batch([group[0] for group in batch_groups], lambda res: events.put(("item", key, res)))
+        finally:
+            events.put(("done", key, status))
+
+    while work:
+        next_work = []
+        resolved = {key: set() for key in range(len(work))}
+        with ThreadPoolExecutor(max_workers=GEMINI_MAX_WORKERS) as executor:
+            for key, (batch_groups, _) in enumerate(work):
+                executor.submit(run, key, batch_groups)
+
+            remaining = len(work)
+            while remaining:
+                kind, key, payload = events.get()
+                batch_groups, attempts = work[key]
+
+                if kind == "item":
+                    idx = payload.get('id')
+                    if isinstance(idx, int) and 0 <= idx < len(batch_groups) and idx not in resolved[key] and payload.get('trans'):
+                        resolved[key].add(idx)
+                        save_classified(conn, item_type, batch_groups[idx], payload)
+                        saved += len(batch_groups[idx])
                     continue
 
-                if "space.com" in source_info["url"]:
-                    if hasattr(entry, 'tags'):
-                        if any(tag.term.strip() == "Entertainment" for tag in entry.tags):
-                            continue
-                
-                all_news.append({
-                    "title": entry.title,
-                    "desc": entry.get('summary', entry.get('description', '내용 없음')),
-                    "link": entry.link,
-                    "date": entry.get('published', datetime.now().strftime("%Y-%m-%d")),
-                    "source": source_name,
-                    "fixed_category": source_info["fixed_category"]
-                })
-                
-                collected_count += 1
-                if collected_count >= 5:
-                    break
-                    
-        except Exception:
-            continue
-    return all_news
+                remaining -= 1
+                if payload == "parse_failed" and len(batch_groups) > 1:
+                    mid = len(batch_groups) // 2
+                    next_work += [(batch_groups[:mid], attempts), (batch_groups[mid:], attempts)]
+                    continue
 
-def fetch_springer_papers(field_kr) -> List[Dict]:
+                missing = [group for idx, group in enumerate(batch_groups) if idx not in resolved[key]]
+                if missing:
+                    if attempts < GEMINI_MAX_REQUEUES:
+                        next_work.append((missing, attempts + 1))
+                    else:
+                        dropped.extend(missing)
+        if next_work:
+            print(f"{item_type}: {sum(len(b) for b, _ in next_work)}개 항목을 {len(next_work)}개 배치로 다시 요청합니다.")
+        work = next_work
+
+    print(f"{item_type}: AI 분류 후 {saved}개 항목 저장")
+    if dropped:
+        print(f"⚠️ {item_type}: {len(dropped)}개 항목을 분류하지 못했습니다. 다음 실행에서 다시 시도합니다.")
+
+    save_story_signatures(conn, item_type, table, col, signatures)
+    unresolved = find_unresolved(conn, table, col, new_items, duplicates)
+    if own_conn:
+        conn.commit()
+        conn.close()
+    return unresolved
+
+def run_fetch_jobs(jobs, max_workers=FETCH_MAX_WORKERS, timeout=FETCH_TIMEOUT) -> List[List[Dict]]:
+    # jobs: [(이름, 함수, 인자 튜플)] -> 같은 순서의 결과 리스트. 실패/시간 초과 소스는 빈 리스트
+    results = [[] for _ in jobs]
+    if not jobs: return results
+
+    # 작업마다 시작 시각 + timeout을 마감으로 걸어 HTTP 대기와 본문 읽기가 그 안에서 끝나게 합니다.
+    # 마감 직후에 돌아온 결과도 받도록 FETCH_DEADLINE_GRACE초만큼 더 기다린 뒤 버립니다.
+    started = {}
+
+    def run(idx, func, args):
+        started[idx] = time.monotonic()
+        fetch_deadline.at = started[idx] + timeout
+        try:
+            return func(*args)
+        finally:
+            fetch_deadline.at = None
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {executor.submit(run, idx, func, args): idx for idx, (_, func, args) in enumerate(jobs)}
+    pending = set(futures)
+
+    while pending:
+        done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+        for fut in done:
+            idx = futures[fut]
+            try:
+                results[idx] = fut.result() or []
+            except Exception as e:
+                print(f"수집 실패 ({jobs[idx][0]}): {e}")
+
+        now = time.monotonic()
+        for fut in list(pending):
+            idx = futures[fut]
+            if idx in started and now - started[idx] > timeout + FETCH_DEADLINE_GRACE:
+                pending.discard(fut)
+                print(f"⏱️ 시간 초과로 건너뜀 ({jobs[idx][0]}): {timeout}초")
+
+    executor.shutdown(wait=False, cancel_futures=True)
+    return results
 
-    if not SPRINGER_API_KEY:
-        print("ℹ️ 알림: SPRINGER_API_KEY가 설정되지 않아 논문 수집을 건너뜁니다.")
-        return []
+def fetch_rss_source(source_info) -> List[Dict]:
+    news = []
+    try:
+        feed = fetch_feed(source_info["url"])
+        if feed is None: return news
+        if "nature.com" in source_info["url"]: source_name = "Nature"
+        elif "science.org" in source_info["url"]: source_name = "Science"
+        elif "sciencedaily" in source_info["url"]: source_name = "ScienceDaily"
+        elif "space.com" in source_info["url"]: source_name = "Space.com"
+        elif "phys.org" in source_info["url"]: source_name = "Phys.org"
+        elif "scientificamerican" in source_info["url"]: source_name = "Scientific American"
+        elif "quantamagazine" in source_info["url"]: source_name = "Quanta Magazine"
+        else: source_name = "Science News"
 
-    base_url = "http://api.springernature.com/meta/v2/json"
+        for entry in feed.entries:
 
-    journal_id_map = {
-        "천문·우주": ["41550"],
-        "인지·신경": ["41593"],
-        "물리학": ["41567"],
-        "생명과학": ["41588", "41591", "41587"],
-        "기타": ["41586"]
-    }
+            if "nature.com" in source_info["url"] and "d41586" not in entry.link:
+                continue
 
-    target_ids = journal_id_map.get(field_kr, ["41586"])
-    
-    journal_q = " OR ".join([f"journalid:{jid}" for jid in target_ids])
-    
-    query = f"({journal_q}) AND type:Journal"
+            if "space.com" in source_info["url"]:
+                if hasattr(entry, 'tags'):
+                    if any(tag.term.strip() == "Entertainment" for tag in entry.tags):
+                        continue
 
-    params = {
-        "q": query,
-        "p": 20,
-        "s": 1,
-        "sort": "date",
-        "api_key": SPRINGER_API_KEY
-    }
+            news.append({
+                "title": entry.title,
+                "desc": entry.get('summary', entry.get('description', '내용 없음')),
+                "link": entry.link,
+                "date": entry.get('published', datetime.now().strftime("%Y-%m-%d")),
+                "source": source_name,
+                "fixed_category": source_info["fixed_category"],
+                "feed_cache": feed.cache_entry
+            })
 
-    papers = []
-    try:
-        response = requests.get(base_url, params=params, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
+            if len(news) >= 5:
+                break
 
-            records = data.get('records', [])
-            
-            for record in records:
-                genres = record.get('genre', [])
-                
-                if "OriginalPaper" not in genres:
-                    continue
+    except Exception:
+        pass
+    return news
+
+SPRINGER_API_URL = "http://api.springernature.com/meta/v2/json"
+SPRINGER_JOURNALS = {
+    "천문·우주": ["41550"],
+    "인지·신경": ["41593"],
+    "물리학": ["41567"],
+    "생명과학": ["41588", "41591", "41587"],
+    "기타": ["41586"]
+}
+SPRINGER_QUOTA = 5
+SPRINGER_PAGE_SIZE = 50
+SPRINGER_MAX_PAGES = 4
+SPRINGER_MIN_PAGE_TIME = 3
+
+def springer_record_link(record):
+    urls = record.get('url', [])
+    for u in urls:
+        if u.get('format') == 'html':
+            return u.get('value')
+    return urls[0].get('value') if urls else ""
+
+def fetch_springer_papers() -> List[Dict]:
+    # 모든 분야의 저널 ID를 OR로 묶은 한 쿼리를 페이지 단위로 읽고, 레코드의 journalId로 분야를 나눕니다.
+    # 분야마다 OriginalPaper를 SPRINGER_QUOTA개 채우면 멈춥니다. 쿼터를 채운 분야의 저널은 다음 요청에서 빼고
+    # 처음부터 다시 읽으므로, 게재량이 적은 저널도 Nature에 밀리지 않고 몇 번 안에 채워집니다.
+    # 수집 마감이 다가오거나 한 페이지가 실패하면 그때까지 채운 분야의 결과를 그대로 돌려줍니다.
+    if not SPRINGER_API_KEY:
+        print("ℹ️ 알림: SPRINGER_API_KEY가 설정되지 않아 논문 수집을 건너뜁니다.")
+        return []
 
-                link = ""
-                urls = record.get('url', [])
-                for u in urls:
-                    if u.get('format') == 'html':
-                        link = u.get('value')
-                        break
-                if not link and urls: link = urls[0].get('value')
+    field_of = {jid: field for field, ids in SPRINGER_JOURNALS.items() for jid in ids}
+    papers = {field: [] for field in SPRINGER_JOURNALS}
+    seen = set()
+    open_fields = list(SPRINGER_JOURNALS)
+    start = 1
+
+    for _ in range(SPRINGER_MAX_PAGES):
+        left = fetch_time_left()
+        if left is not None and left < SPRINGER_MIN_PAGE_TIME:
+            print(f"Springer: 수집 시간이 부족해 {len(open_fields)}개 분야를 채우지 못하고 멈춥니다.")
+            break
+        journal_q = " OR ".join(f"journalid:{jid}" for field in open_fields for jid in SPRINGER_JOURNALS[field])
+        params = {
+            "q": f"({journal_q}) AND type:Journal",
+            "p": SPRINGER_PAGE_SIZE,
+            "s": start,
+            "sort": "date",
+            "api_key": SPRINGER_API_KEY
+        }
+        try:
+            response = http_get(SPRINGER_API_URL, params=params)
+            if response.status_code != 200:
+                print(f"Springer API Error: {response.status_code}")
+                break
+            records = response.json().get('records', [])
+        except Exception as e:
+            print(f"Error fetching Springer papers: {e}")
+            break
+
+        for record in records:
+            field = field_of.get(str(record.get('journalId', '')))
+            if field is None or len(papers[field]) >= SPRINGER_QUOTA:
+                continue
+            if "OriginalPaper" not in record.get('genre', []):
+                continue
+            link = springer_record_link(record)
+            uid = record.get('doi') or link
+            if uid in seen:
+                continue
+            seen.add(uid)
+
+            papers[field].append({
+                "title": record.get('title', '제목 없음'),
+                "desc": "",
+                "link": link,
+                "date": record.get('publicationDate', ''),
+                "source": record.get('publicationName', 'Nature Portfolio')
+            })
 
-                papers.append({
-                    "title": record.get('title', '제목 없음'),
-                    "desc": "", 
-                    "link": link,
-                    "date": record.get('publicationDate', ''),
-                    "source": record.get('publicationName', 'Nature Portfolio')
-                })
-                
-                if len(papers) >= 5:
-                    break
+        still_open = [field for field in open_fields if len(papers[field]) < SPRINGER_QUOTA]
+        if not still_open or len(records) < SPRINGER_PAGE_SIZE:
+            break
+        if still_open != open_fields:
+            open_fields, start = still_open, 1
         else:
-            print(f"Springer API Error ({field_kr}): {response.status_code}")
-    except Exception as e:
-        print(f"Error fetching papers for {field_kr}: {e}")
+            start += SPRINGER_PAGE_SIZE
 
-    return papers
+    return [paper for field in SPRINGER_JOURNALS for paper in papers[field]]
 
 def fetch_science_org_papers() -> List[Dict]:
     print("Science.org RSS 논문 필터링 및 수집 중...")
     papers = []
     try:
-        feed = feedparser.parse(SCIENCE_RSS_URL)
+        feed = fetch_feed(SCIENCE_RSS_URL)
+        if feed is None: return papers
         
         valid_types = ["Research Article", "Review"]
 
@@ -334,7 +1257,8 @@ def fetch_science_org_papers() -> List[Dict]:
                     "desc": clean_html(entry.get('summary', entry.get('description', ''))),
                     "link": entry.link,
                     "date": entry.get('published', datetime.now().strftime("%Y-%m-%d")),
-                    "source": "Science"
+                    "source": "Science",
+                    "feed_cache": feed.cache_entry
                 })
             
             if len(papers) >= 10:
@@ -350,7 +1274,8 @@ def fetch_apj_papers() -> List[Dict]:
     papers = []
     rss_url = "https://iopscience.iop.org/journal/rss/0004-637X"
     try:
-        feed = feedparser.parse(rss_url)
+        feed = fetch_feed(rss_url)
+        if feed is None: return papers
         for entry in feed.entries:
             papers.append({
                 "title": entry.title,
@@ -358,7 +1283,8 @@ def fetch_apj_papers() -> List[Dict]:
                 "link": entry.link,
                 "date": entry.get('published', datetime.now().strftime("%Y-%m-%d")),
                 "source": "The Astrophysical Journal (ApJ)",
-                "fixed_category": "천문·우주"
+                "fixed_category": "천문·우주",
+                "feed_cache": feed.cache_entry
             })
             if len(papers) >= 5:
                 break
@@ -366,103 +1292,95 @@ def fetch_apj_papers() -> List[Dict]:
         print(f"ApJ RSS 에러: {e}")
     return papers
 
-def fetch_all_reviews() -> List[Dict]:
-    print("리뷰 논문 수집 시작...")
+def fetch_review_source(source) -> List[Dict]:
     results = []
-    for source in REVIEW_SOURCES:
-        try:
-            feed = feedparser.parse(source["url"])
-            for entry in feed.entries[:5]:
-                results.append({
-                    "title": entry.title,
-                    "link": entry.link,
-                    "date": entry.get('published', datetime.now().strftime("%Y-%m-%d")),
-                    "source": source["name"],
-                    "fixed_category": source["field"],
-                    "type": "Reviews Paper"
-                })
-        except Exception as e:
-            print(f"수집 실패 ({source['name']}): {e}")
+    try:
+        feed = fetch_feed(source["url"])
+        if feed is None: return results
+        for entry in islice(feed.entries, 5):
+            results.append({
+                "title": entry.title,
+                "link": entry.link,
+                "date": entry.get('published', datetime.now().strftime("%Y-%m-%d")),
+                "source": source["name"],
+                "fixed_category": source["field"],
+                "type": "Reviews Paper",
+                "feed_cache": feed.cache_entry
+            })
+    except Exception as e:
+        print(f"수집 실패 ({source['name']}): {e}")
     return results
 
-def fetch_videos() -> List[Dict]:
-    print("유튜브 영상 목록 가져오는 중...")
-    all_vids = []
-    
-    for source in YOUTUBE_SOURCES:
-        try:
-            source_type = 'playlist_id' if source.get('type') == 'playlist' else 'channel_id'
-            url = f"https://www.youtube.com/feeds/videos.xml?{source_type}={source['id']}"
-            feed = feedparser.parse(url)
-            
-            collected_count = 0
-    
-            for entry in feed.entries:
-                if "/shorts/" in entry.link:
-                    continue
+def fetch_video_source(source) -> List[Dict]:
+    vids = []
+    try:
+        source_type = 'playlist_id' if source.get('type') == 'playlist' else 'channel_id'
+        url = f"https://www.youtube.com/feeds/videos.xml?{source_type}={source['id']}"
+        feed = fetch_feed(url)
+        if feed is None: return vids
 
-                all_vids.append({
-                    "id": entry.yt_videoid,
-                    "title": entry.title,
-                    "link": entry.link,
-                    "thumbnail": f"https://img.youtube.com/vi/{entry.yt_videoid}/mqdefault.jpg",
-                    "date": entry.published,
-                    "source": entry.get('author', 'YouTube')
-                })
+        for entry in feed.entries:
+            if "/shorts/" in entry.link:
+                continue
 
-                collected_count += 1
-                if collected_count >= 3:
-                    break
+            vids.append({
+                "id": entry.yt_videoid,
+                "title": entry.title,
+                "link": entry.link,
+                "thumbnail": f"https://img.youtube.com/vi/{entry.yt_videoid}/mqdefault.jpg",
+                "date": entry.published,
+                "source": entry.get('author', 'YouTube'),
+                "feed_cache": feed.cache_entry
+            })
 
-        except Exception:
-            continue
-            
-    return all_vids
+            if len(vids) >= 3:
+                break
 
-def collect_and_process_data():
-    init_db()
-    
-    raw_vids = fetch_videos()
-    raw_news = fetch_rss_news()
-    raw_papers = fetch_science_org_papers()
-    raw_reviews = fetch_all_reviews()
+    except Exception:
+        pass
+    return vids
 
-    apj_papers = fetch_apj_papers()
-    raw_papers.extend(apj_papers)
-    
-    for field in SCIENCE_FIELDS: raw_papers.extend(fetch_springer_papers(field))
+def fetch_all_sources():
+    # 모든 소스를 하나의 작업 목록으로 만들어 동시에 수집하고, 그룹별로 원래 순서대로 모읍니다.
+    plan = [("videos", f"YouTube {s['id']}", fetch_video_source, (s,)) for s in YOUTUBE_SOURCES]
+    plan += [("news", s["url"], fetch_rss_source, (s,)) for s in RSS_SOURCES]
+    plan.append(("papers", "Science.org", fetch_science_org_papers, ()))
+    plan += [("reviews", s["name"], fetch_review_source, (s,)) for s in REVIEW_SOURCES]
+    plan.append(("papers", "ApJ", fetch_apj_papers, ()))
+    plan.append(("papers", "Springer", fetch_springer_papers, ()))
 
-    classify_and_save_to_db(raw_vids, 'video')
-    classify_and_save_to_db(raw_news, 'news')
-    classify_and_save_to_db(raw_papers, 'paper')
-    classify_and_save_to_db(raw_reviews, 'Reviews Paper')
+    print(f"피드 동시 수집 시작 ({len(plan)}개 소스, 최대 {FETCH_MAX_WORKERS}개 병렬, 소스당 {FETCH_TIMEOUT}초 제한)...")
+    results = run_fetch_jobs([(name, func, args) for _, name, func, args in plan])
 
-    all_data = {field: {"news": [], "videos": [], "papers": [], "reviews": [], "data": []} for field in SCIENCE_FIELDS}
-    conn = sqlite3.connect(DB_FILE)
-    c = conn.cursor()
+    grouped = {"videos": [], "news": [], "papers": [], "reviews": []}
+    for (group, _, _, _), items in zip(plan, results):
+        grouped[group].extend(items)
+    return grouped
 
-    for field in SCIENCE_FIELDS:
-        c.execute("""SELECT title, link, source, pub_date FROM articles 
-                     WHERE category = ? AND type = 'news' 
-                     ORDER BY pub_date DESC LIMIT 10""", (field,))
-        for r in c.fetchall():
-            all_data[field]["news"].append({"title": r[0], "link": r[1], "source": r[2], "date": r[3]})
-
-        c.execute("""SELECT title, link, source, pub_date FROM articles 
-                     WHERE category = ? AND type = 'paper' 
-                     ORDER BY pub_date DESC LIMIT 10""", (field,))
-        for r in c.fetchall():
-            all_data[field]["papers"].append({"title": r[0], "link": r[1], "source": r[2], "date": r[3]})
-            
-        all_data[field]["videos"] = get_latest_videos(category=field, limit=5)
-        
-        c.execute("""SELECT title, link, source, pub_date FROM articles 
-                     WHERE category = ? AND type = 'Reviews Paper' 
-                     ORDER BY pub_date DESC LIMIT 10""", (field,))
-        for r in c.fetchall():
-            all_data[field]["reviews"].append({"title": r[0], "link": r[1], "source": r[2], "date": r[3]})
+def collect_and_process_data():
+    init_db()
+    init_feed_cache()
+
+    fetched = fetch_all_sources()
+    raw_vids = fetched["videos"]
+    raw_news = fetched["news"]
+    raw_papers = fetched["papers"]
+    raw_reviews = fetched["reviews"]
+
+    conn = connect_db()
+    with conn:
+        unresolved = classify_and_save_to_db(raw_vids, 'video', conn)
+        unresolved += classify_and_save_to_db(raw_news, 'news', conn)
+        unresolved += classify_and_save_to_db(raw_papers, 'paper', conn)
+        unresolved += classify_and_save_to_db(raw_reviews, 'Reviews Paper', conn)
+    save_feed_cache(raw_vids + raw_news + raw_papers + raw_reviews, unresolved)
+
+    latest = get_latest_by_field(conn)
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     conn.close()
 
+    all_data = {field: {**latest[field], "data": []} for field in SCIENCE_FIELDS}
+
     neuro_journals = [
         {"title": "Neuron", "desc": "신경과학 분야 최고의 권위를 자랑하며 세포 및 시스템 신경과학을 다룹니다.", "link": "https://www.cell.com/neuron/home", "source": "Cell Press"}
     ]
@@ -517,8 +1435,222 @@ def collect_and_process_data():
 
     return all_data
 
-def generate_html(science_data, nasa_data):
-    full_payload = json.dumps({"science": science_data, "nasa": nasa_data}, ensure_ascii=False)
+BRAIN_MAGIC = b"BRNM"
+BRAIN_VERSION = 2
+BRAIN_FLAG_UINT32_INDEX = 1
+BRAIN_HEADER_SIZE = 56
+CEREBELLUM_ID = 6
+CEREBELLUM_SCALE = 0.85
+
+def to_little_endian(arr):
+    if struct.pack("=H", 1) != struct.pack("<H", 1):
+        arr.byteswap()
+    return arr.tobytes()
+
+def pad4(blob):
+    return blob + b"\0" * (-len(blob) % 4)
+
+def preprocess_brain(vertices, types):
+    # 바운딩 박스 중심 맞추기와 소뇌 축소를 미리 적용한 최종 좌표를 돌려줍니다.
+    lo = [min(v[axis] for v in vertices) for axis in range(3)]
+    hi = [max(v[axis] for v in vertices) for axis in range(3)]
+    center = [(lo[axis] + hi[axis]) / 2 for axis in range(3)]
+    positions = [[v[axis] - center[axis] for axis in range(3)] for v in vertices]
+
+    cerebellum = [i for i, t in enumerate(types) if t == CEREBELLUM_ID]
+    if cerebellum:
+        c = [sum(positions[i][axis] for i in cerebellum) / len(cerebellum) for axis in range(3)]
+        for i in cerebellum:
+            positions[i] = [(positions[i][axis] - c[axis]) * CEREBELLUM_SCALE + c[axis] for axis in range(3)]
+    return positions
+
+def unique_edges(faces):
+    edges = {}
+    for a, b, c in faces:
+        for u, v in ((a, b), (b, c), (c, a)):
+            edges.setdefault((u, v) if u < v else (v, u), None)
+    return list(edges)
+
+def cluster_vertices(positions, faces, cell):
+    # 정점 클러스터링 단순화: 한 변이 cell인 격자 칸마다 정점을 평균 하나로 합치고, 찌그러진 면은 버립니다.
+    lo = [min(p[axis] for p in positions) for axis in range(3)]
+    clusters = {}
+    sums = []
+    remap = []
+    for p in positions:
+        key = tuple(int((p[axis] - lo[axis]) // cell) for axis in range(3))
+        idx = clusters.get(key)
+        if idx is None:
+            idx = clusters[key] = len(sums)
+            sums.append([0.0, 0.0, 0.0, 0])
+        s = sums[idx]
+        s[0] += p[0]; s[1] += p[1]; s[2] += p[2]; s[3] += 1
+        remap.append(idx)
+
+    merged = [[s[0] / s[3], s[1] / s[3], s[2] / s[3]] for s in sums]
+    merged_faces = []
+    for a, b, c in faces:
+        a, b, c = remap[a], remap[b], remap[c]
+        if a != b and b != c and a != c:
+            merged_faces.append((a, b, c))
+    return merged, merged_faces
+
+def encode_brain_mesh(positions, edges):
+    # 헤더(56바이트, little-endian): magic, version(u16), flags(u16), 정점 수(u32), 모서리 인덱스 수(u32),
+    #   offset(3 x f32), scale(3 x f32), 정규화 좌표 기준 bounding sphere(중심 3 x f32, 반지름 f32)
+    # 본문: Uint16 양자화 좌표(position = offset + q / 65535 * scale), Uint16/Uint32 모서리 인덱스
+    lo = [min(p[axis] for p in positions) for axis in range(3)]
+    hi = [max(p[axis] for p in positions) for axis in range(3)]
+    scale = [(hi[axis] - lo[axis]) or 1.0 for axis in range(3)]
+
+    quantized = array("H", (round((p[axis] - lo[axis]) / scale[axis] * 65535) for p in positions for axis in range(3)))
+    normalized = [[quantized[i * 3 + axis] / 65535 for axis in range(3)] for i in range(len(positions))]
+    sphere_center = [(min(n[axis] for n in normalized) + max(n[axis] for n in normalized)) / 2 for axis in range(3)]
+    sphere_radius = max(sum((n[axis] - sphere_center[axis]) ** 2 for axis in range(3)) for n in normalized) ** 0.5
+
+    flags = BRAIN_FLAG_UINT32_INDEX if len(positions) > 65536 else 0
+    edge_array = array("I" if flags & BRAIN_FLAG_UINT32_INDEX else "H", (i for edge in edges for i in edge))
+
+    header = BRAIN_MAGIC + struct.pack("<HHII3f3f4f", BRAIN_VERSION, flags, len(positions), len(edge_array),
+                                       *lo, *scale, *sphere_center, sphere_radius)
+    blob = pad4(header + to_little_endian(quantized))
+    return blob + to_little_endian(edge_array)
+
+def build_brain_assets(src=BRAIN_SOURCE):
+    # 거친 단계부터 원본까지 LOD별 바이너리(brain.lod0.bin ... )를 만듭니다. 마지막 단계가 원본 해상도입니다.
+    with open(src, encoding="utf-8") as f:
+        data = json.load(f)
+    types = data.get("types") or [0] * len(data["vertices"])
+    positions = preprocess_brain(data["vertices"], types)
+    faces = data["faces"]
+
+    levels = [cluster_vertices(positions, faces, cell) for cell in BRAIN_LOD_CELL_SIZES] + [(positions, faces)]
+    for dst, (level_positions, level_faces) in zip(BRAIN_LOD_ASSETS, levels):
+        edges = unique_edges(level_faces)
+        blob = encode_brain_mesh(level_positions, edges)
+        with open(dst, "wb") as f:
+            f.write(blob)
+        print(f"{dst} 생성: 정점 {len(level_positions):,}개, 모서리 {len(edges):,}개, {len(blob):,} bytes")
+
+def brain_assets_fingerprint(src=BRAIN_SOURCE):
+    with open(src, "rb") as f:
+        source = f.read()
+    code = [inspect.getsource(func) for func in (preprocess_brain, unique_edges, cluster_vertices, encode_brain_mesh)]
+    return fingerprint(source, code, BRAIN_LOD_CELL_SIZES, BRAIN_LOD_ASSETS, CEREBELLUM_ID, CEREBELLUM_SCALE)
+
+def fingerprint(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = json.dumps(part, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+def load_build_manifest():
+    try:
+        with open(BUILD_MANIFEST, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"outputs": {}, "db": None}
+
+def save_build_manifest(manifest):
+    with open(BUILD_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+def build_if_changed(manifest, outputs, inputs_hash, build):
+    # 출력 파일들의 입력 해시가 지난 빌드와 같고 파일이 남아 있으면 build()를 건너뜁니다.
+    if all(manifest["outputs"].get(path) == inputs_hash and os.path.exists(path) for path in outputs):
+        print(f"변경 없음, 건너뜀: {', '.join(outputs)}")
+        return False
+    build()
+    for path in outputs:
+        manifest["outputs"][path] = inputs_hash
+    return True
+
+def db_fingerprint():
+    conn = connect_db()
+    digest = fingerprint(
+        conn.execute("SELECT link, title, pub_date, category, source, type FROM articles ORDER BY link").fetchall(),
+        conn.execute("SELECT id, title, link, thumbnail, pub_date, category, source FROM videos ORDER BY id").fetchall(),
+        conn.execute("SELECT key, tags, trans FROM translation_cache ORDER BY key").fetchall(),
+    )
+    conn.close()
+    return digest
+
+def write_github_output(**values):
+    path = os.environ.get("GITHUB_OUTPUT")
+    if not path: return
+    with open(path, "a", encoding="utf-8") as f:
+        for key, value in values.items():
+            f.write(f"{key}={value}\n")
+
+def write_shard(name, payload):
+    # 내용 해시를 파일 이름에 넣어, 내용이 같으면 URL도 같아 브라우저 캐시를 그대로 쓸 수 있게 합니다.
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    path = f"{DATA_DIR}/{name}.{hashlib.sha256(body).hexdigest()[:12]}.json"
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(body)
+    return path
+
+def write_data_shards(science_data, nasa_data):
+    # 분야 x 종류별 JSON 조각을 쓰고 {"science": {분야: {종류: URL}}, "nasa": URL} 목록을 manifest.json에 기록합니다.
+    # 목록을 index.html에 넣지 않으므로 데이터가 바뀌어도 index.html은 그대로 남습니다.
+    os.makedirs(DATA_DIR, exist_ok=True)
+    manifest = {"science": {}, "nasa": write_shard("apod", nasa_data)}
+    for field in SCIENCE_FIELDS:
+        manifest["science"][field] = {key: write_shard(f"{FIELD_SLUGS[field]}-{key}", items)
+                                      for key, items in science_data.get(field, {}).items()}
+
+    write_if_changed(SHARD_MANIFEST, json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    live = {SHARD_MANIFEST, manifest["nasa"]} | {url for urls in manifest["science"].values() for url in urls.values()}
+    for name in os.listdir(DATA_DIR):
+        path = f"{DATA_DIR}/{name}"
+        base = re.sub(r"\.(gz|br)$", "", path)
+        if base.endswith(".json") and base not in live:
+            os.remove(path)
+    return manifest
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+def minify_html(html):
+    # 보수적인 압축: 줄 앞뒤 공백과 빈 줄, 줄 전체가 주석인 JS 줄을 지웁니다. 줄바꿈은 남겨 JS의 자동 세미콜론 규칙을 건드리지 않습니다.
+    # <style> 안은 CSS 규칙에 맞춰 한 줄로 압축합니다.
+    html = re.sub(r"(<style>)(.*?)(</style>)", lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3), html, flags=re.DOTALL)
+    lines = (line.strip() for line in html.split("\n"))
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+def write_if_changed(path, blob):
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if f.read() == blob:
+                return
+    with open(path, "wb") as f:
+        f.write(blob)
+
+def precompress(paths):
+    # 정적 호스트가 그대로 내려줄 수 있도록 .gz(.br) 형제 파일을 만들고 크기 표를 출력합니다.
+    print(f"{'artifact':<40}{'raw':>10}{'gzip':>10}{'brotli':>10}")
+    for path in paths:
+        with open(path, "rb") as f:
+            raw = f.read()
+        gz = gzip.compress(raw, compresslevel=9, mtime=0)
+        write_if_changed(path + ".gz", gz)
+        br_size = "-"
+        if HAS_BROTLI:
+            br = brotli.compress(raw, quality=11)
+            write_if_changed(path + ".br", br)
+            br_size = f"{len(br):,}"
+        print(f"{path:<40}{len(raw):>10,}{len(gz):>10,}{br_size:>10}")
+
+def generate_html():
     field_buttons_html = "".join([f'<button class="tab-btn" onclick="window.showField(\'{f}\')">{f}</button>' for f in SCIENCE_FIELDS])
     universe_quote = """
     "삶에 별빛을 섞으세요. <br>하찮은 일에 마음이 괴롭지 않을 겁니다." <br>
@@ -589,19 +1721,7 @@ def generate_html(science_data, nasa_data):
     height: 320px; 
     position: relative; 
 }}
-        .dna-container {{ position: relative; width: 100%; height: 100%; }}
-        .dna-dot {{
-            position: absolute; border-radius: 50%;
-            background: radial-gradient(circle, rgba(255, 255, 255, 1) 0%, rgba(0, 170, 255, 1) 30%, rgba(0, 80, 255, 0.1) 70%, transparent 100%);
-            mix-blend-mode: screen; filter: drop-shadow(0 0 5px rgba(0, 170, 255, 0.8));
-        }}
-
-.dna-line {{
-    position: absolute; 
-    height: 1px;
-    background: linear-gradient(90deg, rgba(153, 187, 255, 0) 0%, rgba(153, 187, 255, 1) 50%, rgba(153, 187, 255, 0) 100%);
-    z-index: -1;
-}}
+        .dna-container {{ position: relative; display: block; width: 100%; height: 100%; mix-blend-mode: screen; }}
         .digital-glow {{ filter: drop-shadow(0 0 15px rgba(0, 170, 255, 0.4)); }}
 
         .header-content {{ position: relative; z-index: 1; pointer-events: none; transition: opacity 0.5s; }}
@@ -651,7 +1771,7 @@ def generate_html(science_data, nasa_data):
         .nasa-credit {{ font-size: 0.85rem; color: #666; margin-top: 20px; padding-top: 20px; border-top: 1px solid #222; }}
 
         .card-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(320px, 1fr)); gap: 20px; animation: fadeIn 0.4s; }}
-        .card {{ background-color: var(--card-bg); border: 1px solid var(--border); border-radius: 4px; padding: 25px; transition: all 0.3s; display: flex; flex-direction: column; text-decoration: none; color: inherit; position: relative; overflow: hidden; cursor: pointer; }}
+        .card {{ background-color: var(--card-bg); border: 1px solid var(--border); border-radius: 4px; padding: 25px; transition: all 0.3s; display: flex; flex-direction: column; text-decoration: none; color: inherit; position: relative; overflow: hidden; cursor: pointer; content-visibility: auto; contain-intrinsic-size: auto 180px; }}
         .card:hover {{ border-color: #ffffff; background-color: #111111; transform: translateY(-3px); }}
         .source-tag {{ font-size: 10px; background: #fff; color: #000; padding: 2px 6px; border-radius: 2px; position: absolute; top: 15px; right: 15px; font-weight: bold; z-index: 2; }}
         .ai-tag {{ font-size: 10px; color: #888; border: 1px solid #333; padding: 2px 8px; border-radius: 12px; display: inline-block; margin-bottom: 12px; align-self: flex-start; }}
@@ -739,7 +1859,7 @@ def generate_html(science_data, nasa_data):
 
         <div id="dna-outer-container" class="header-content">
             <div class="dna-header-wrapper">
-                <div class="dna-container digital-glow" id="dna-animation-box"></div>
+                <canvas class="dna-container digital-glow" id="dna-animation-box"></canvas>
             </div>
         </div>
 
@@ -758,7 +1878,35 @@ def generate_html(science_data, nasa_data):
         import {{ RenderPass }} from 'three/addons/postprocessing/RenderPass.js';
         import {{ UnrealBloomPass }} from 'three/addons/postprocessing/UnrealBloomPass.js';
 
-        const fullData = {full_payload};
+        const shardCache = new Map();
+        let manifestRequest = null;
+        const TYPE_KEYS = {{ news: 'news', videos: 'videos', papers: 'papers', 'Reviews Paper': 'reviews', data: 'data' }};
+        let renderToken = 0;
+
+        function loadManifest() {{
+            // 조각 URL 목록은 데이터와 함께 바뀌므로 매번 서버에 갱신 여부를 확인합니다.
+            if (!manifestRequest) {{
+                manifestRequest = fetch('{SHARD_MANIFEST}', {{ cache: 'no-cache' }}).then(r => {{
+                    if (!r.ok) throw new Error(r.status);
+                    return r.json();
+                }});
+                manifestRequest.catch(() => {{ manifestRequest = null; }});
+            }}
+            return manifestRequest;
+        }}
+
+        function loadShard(url) {{
+            if (!url) return Promise.resolve(null);
+            if (!shardCache.has(url)) {{
+                const request = fetch(url).then(r => {{
+                    if (!r.ok) throw new Error(r.status);
+                    return r.json();
+                }});
+                request.catch(() => shardCache.delete(url));
+                shardCache.set(url, request);
+            }}
+            return shardCache.get(url);
+        }}
         let currentField = "천문·우주";
         let currentType = "apod";
 
@@ -766,15 +1914,138 @@ def generate_html(science_data, nasa_data):
         const universeCtx = universeCanvas.getContext('2d');
         const headerContainer = document.getElementById('header-container');
         
+        // 세 시각화(우주·뇌·DNA)가 함께 쓰는 단일 프레임 스케줄러입니다. 장면마다 fps 상한을 두고,
+        // 탭이 숨겨졌거나 장면이 화면 밖이면 멈추며, prefers-reduced-motion이면 정지 화면 한 장만 그립니다.
+        // 측정한 프레임 간격이 예산을 넘으면 장면의 degrade()로 품질을 낮추고, 더 낮출 게 없으면 fps를 내립니다.
+        const frameScheduler = (() => {{
+            const MIN_FPS = 15;
+            const QUALITY_SAMPLES = 60;
+            const reducedMotion = window.matchMedia('(prefers-reduced-motion: reduce)');
+            const scenes = new Map();
+            let rafId = null, staticId = null;
+
+            const observer = new IntersectionObserver(entries => {{
+                for (const entry of entries) {{
+                    for (const scene of scenes.values()) {{
+                        if (scene.element === entry.target) scene.visible = entry.isIntersecting;
+                    }}
+                }}
+                update();
+            }});
+
+            function runnable(scene) {{
+                return scene.active && scene.visible && !document.hidden;
+            }}
+
+            function resetSamples(scene) {{
+                scene.sampleSum = 0;
+                scene.sampleCount = 0;
+            }}
+
+            // 정지 모드의 다시 그리기는 다음 프레임으로 미룹니다. tick 안에서 invalidate가 불려도 재귀하지 않습니다.
+            function drawStatic(now) {{
+                staticId = null;
+                for (const scene of scenes.values()) {{
+                    if (!runnable(scene) || scene.drawn) continue;
+                    scene.drawn = true;
+                    scene.tick(0, now);
+                }}
+            }}
+
+            function update() {{
+                const animate = !reducedMotion.matches;
+                let running = false, redraw = false;
+                for (const scene of scenes.values()) {{
+                    if (!runnable(scene)) {{
+                        scene.last = 0;
+                        resetSamples(scene);
+                        continue;
+                    }}
+                    if (animate) running = true;
+                    else if (!scene.drawn) redraw = true;
+                }}
+                if (redraw && staticId === null) staticId = requestAnimationFrame(drawStatic);
+                if (running && rafId === null) {{
+                    rafId = requestAnimationFrame(loop);
+                }} else if (!running && rafId !== null) {{
+                    cancelAnimationFrame(rafId);
+                    rafId = null;
+                }}
+            }}
+
+            function trackQuality(scene, elapsed, interval) {{
+                scene.sampleSum += elapsed;
+                if (++scene.sampleCount < QUALITY_SAMPLES) return;
+                const avg = scene.sampleSum / scene.sampleCount;
+                scene.sampleSum = 0;
+                scene.sampleCount = 0;
+                if (avg <= interval * 1.25) {{
+                    if (scene.upgrade) scene.upgrade();
+                    return;
+                }}
+                if (scene.degrade && scene.degrade()) return;
+                scene.fps = Math.max(MIN_FPS, scene.fps / 2);
+            }}
+
+            function loop(now) {{
+                rafId = requestAnimationFrame(loop);
+                for (const scene of scenes.values()) {{
+                    if (!runnable(scene)) continue;
+                    const interval = 1000 / scene.fps;
+                    // 1ms 여유: 60Hz 화면에서 30fps 장면이 두 프레임마다 정확히 돌도록 합니다.
+                    if (scene.last && now - scene.last < interval - 1) continue;
+                    if (scene.last) trackQuality(scene, now - scene.last, interval);
+                    const dt = scene.last ? Math.min(now - scene.last, 100) : interval;
+                    scene.last = now;
+                    scene.tick(dt, now);
+                }}
+            }}
+
+            document.addEventListener('visibilitychange', update);
+            reducedMotion.addEventListener('change', update);
+
+            return {{
+                register(name, {{ element, fps, tick, degrade, upgrade }}) {{
+                    scenes.set(name, {{ element, fps, tick, degrade, upgrade, active: false, visible: true, drawn: false, last: 0, sampleSum: 0, sampleCount: 0 }});
+                    observer.observe(element);
+                }},
+                setActive(name, active) {{
+                    const scene = scenes.get(name);
+                    scene.active = active;
+                    if (!active) scene.drawn = false;
+                    update();
+                }},
+                // 장면 내용이 바뀌었음을 알립니다. 애니메이션 중이면 품질 측정 표본만 비우고(프레임 간격과 fps 상한은
+                // 그대로), 정지 모드면 다음 프레임에 한 번 다시 그립니다.
+                invalidate(name) {{
+                    const scene = scenes.get(name);
+                    if (!scene) return;
+                    scene.drawn = false;
+                    resetSamples(scene);
+                    update();
+                }},
+                isStatic() {{
+                    return reducedMotion.matches;
+                }},
+            }};
+        }})();
+
+        // 프레임 간격(ms)을 60fps 기준 배수로 바꿉니다. 움직임 속도를 fps 상한과 무관하게 유지합니다.
+        const FRAME_MS = 1000 / 60;
+
         let universeW, universeH, universeDpr = Math.max(1, window.devicePixelRatio || 1);
-        let stars = [];
-        let animationIdUniverse = null;
+        // 별 상태는 typed array에, 색상 x 크기 구간별 방사형 그라디언트는 미리 그려 둔 스프라이트로 둡니다.
+        const STAR_COLORS = [[255, 255, 255], [170, 191, 255], [255, 210, 161], [255, 204, 111]];
+        const STAR_SIZE_BUCKETS = 8;
+        const STAR_MIN_R = 0.2, STAR_MAX_R = 2.0;
+        let starCount = 0;
+        let starX, starY, starR, starTw, starTwSpeed, starBaseAlpha, starSprite;
+        let starSprites = [];
         let lastWidth = window.innerWidth;
 
         function initUniverse() {{
             resizeUniverse(true);
             window.addEventListener('resize', () => resizeUniverse(false));
-            animateUniverse();
         }}
 
         function resizeUniverse(force) {{
@@ -794,66 +2065,90 @@ def generate_html(science_data, nasa_data):
             universeCtx.setTransform(universeDpr, 0, 0, universeDpr, 0, 0);
             
             createStars(Math.round((universeW * universeH) / 1000)); 
+            frameScheduler.invalidate('universe');
+        }}
+
+        function degradeUniverse() {{
+            if (universeDpr <= 1) return false;
+            universeDpr = 1;
+            starSprites = [];
+            resizeUniverse(true);
+            return true;
+        }}
+
+        function starBucket(r) {{
+            return Math.min(STAR_SIZE_BUCKETS - 1, Math.floor((r - STAR_MIN_R) / (STAR_MAX_R - STAR_MIN_R) * STAR_SIZE_BUCKETS));
+        }}
+
+        function createStarSprites() {{
+            starSprites = [];
+            for (const [r, g, b] of STAR_COLORS) {{
+                for (let bucket = 0; bucket < STAR_SIZE_BUCKETS; bucket++) {{
+                    const radius = STAR_MIN_R + (bucket + 1) * (STAR_MAX_R - STAR_MIN_R) / STAR_SIZE_BUCKETS;
+                    const size = Math.max(2, Math.ceil(radius * 2 * universeDpr));
+                    const sprite = document.createElement('canvas');
+                    sprite.width = sprite.height = size;
+                    const ctx = sprite.getContext('2d');
+                    const gradient = ctx.createRadialGradient(size / 2, size / 2, 0, size / 2, size / 2, size / 2);
+                    gradient.addColorStop(0, `rgba(${{r}}, ${{g}}, ${{b}}, 1)`);
+                    gradient.addColorStop(0.5, `rgba(${{r}}, ${{g}}, ${{b}}, 0.5)`);
+                    gradient.addColorStop(1, `rgba(${{r}}, ${{g}}, ${{b}}, 0)`);
+                    ctx.fillStyle = gradient;
+                    ctx.fillRect(0, 0, size, size);
+                    starSprites.push(sprite);
+                }}
+            }}
         }}
 
         function createStars(count) {{
-            stars = [];
+            if (!starSprites.length) createStarSprites();
+            starCount = count;
+            starX = new Float32Array(count);
+            starY = new Float32Array(count);
+            starR = new Float32Array(count);
+            starTw = new Float32Array(count);
+            starTwSpeed = new Float32Array(count);
+            starBaseAlpha = new Float32Array(count);
+            starSprite = new Uint8Array(count);
+
             for (let i = 0; i < count; i++) {{
                 const colorRand = Math.random();
-                let color;
-                if (colorRand < 0.7) {{
-                    color = '#ffffff';
-                }} else if (colorRand < 0.82) {{
-                    color = '#aabfff';
-                }} else if (colorRand < 0.94) {{
-                    color = '#ffd2a1';
-                }} else {{
-                    color = '#ffcc6f';
-                }}
-
-                stars.push({{ 
-                    x: Math.random() * universeW, 
-                    y: Math.random() * universeH, 
-                    r: Math.pow(Math.random(), 3) * 1.8 + 0.2, 
-                    tw: Math.random() * Math.PI * 2, 
-                    twSpeed: Math.random() * 0.01 + 0.005, 
-                    c: color 
-                }});
+                const color = colorRand < 0.7 ? 0 : colorRand < 0.82 ? 1 : colorRand < 0.94 ? 2 : 3;
+                const r = Math.pow(Math.random(), 3) * 1.8 + 0.2;
+
+                starX[i] = Math.random() * universeW;
+                starY[i] = Math.random() * universeH;
+                starR[i] = r;
+                starTw[i] = Math.random() * Math.PI * 2;
+                starTwSpeed[i] = Math.random() * 0.01 + 0.005;
+                starBaseAlpha[i] = (r / 2.0) * 0.7 + 0.3;
+                starSprite[i] = color * STAR_SIZE_BUCKETS + starBucket(r);
             }}
         }}
 
-        function animateUniverse() {{
+        function animateUniverse(dt) {{
+            const step = dt / FRAME_MS;
             universeCtx.clearRect(0, 0, universeW, universeH);
             
-            stars.forEach(s => {{
-                s.tw += s.twSpeed; 
-                
-                const baseAlpha = (s.r / 2.0) * 0.7 + 0.3;
-                const twinkleAlpha = 0.5 + Math.sin(s.tw) * 0.5;
-                universeCtx.globalAlpha = baseAlpha * twinkleAlpha;
-                
-                const gradient = universeCtx.createRadialGradient(s.x, s.y, 0, s.x, s.y, s.r);
-                const starColorHex = s.c.substring(1);
-                const r = parseInt(starColorHex.slice(0, 2), 16);
-                const g = parseInt(starColorHex.slice(2, 4), 16);
-                const b = parseInt(starColorHex.slice(4, 6), 16);
-                
-                gradient.addColorStop(0, `rgba(${{r}}, ${{g}}, ${{b}}, 1)`);
-                gradient.addColorStop(0.5, `rgba(${{r}}, ${{g}}, ${{b}}, 0.5)`);
-                gradient.addColorStop(1, `rgba(${{r}}, ${{g}}, ${{b}}, 0)`);
-                
-                universeCtx.fillStyle = gradient;
-                universeCtx.beginPath(); 
-                universeCtx.arc(s.x, s.y, s.r, 0, Math.PI * 2); 
-                universeCtx.fill();
-            }});
+            for (let i = 0; i < starCount; i++) {{
+                starTw[i] += starTwSpeed[i] * step;
+                universeCtx.globalAlpha = starBaseAlpha[i] * (0.5 + Math.sin(starTw[i]) * 0.5);
+                const r = starR[i];
+                universeCtx.drawImage(starSprites[starSprite[i]], starX[i] - r, starY[i] - r, r * 2, r * 2);
+            }}
             
             universeCtx.globalAlpha = 1;
-            animationIdUniverse = requestAnimationFrame(animateUniverse);
         }}
 
         let brainScene, brainCamera, brainRenderer, brainControls, brainGroup, brainComposer, brainInitialized = false;
-        let animationIdBrain;
+
+        // LOD: 거친 단계(0)부터 보여 주고, 측정한 프레임 시간이 예산 안일 때만 한 단계씩 올립니다.
+        // 예산을 넘으면 먼저 픽셀 비율을, 그다음 LOD 단계를 낮추고 그 위로는 다시 올리지 않습니다.
+        const BRAIN_LODS = {json.dumps(BRAIN_LOD_ASSETS)};
+        let brainLevels = [], brainLevel = -1, brainMaxLevel = BRAIN_LODS.length - 1;
+        let brainPixelRatio = Math.min(window.devicePixelRatio || 1, 2);
+        let brainMaterials = null;
+        let brainUpgrading = false;
 
         async function initBrain() {{
             if (brainInitialized) return;
@@ -872,7 +2167,7 @@ def generate_html(science_data, nasa_data):
 
             brainRenderer = new THREE.WebGLRenderer({{ antialias: true }});
             brainRenderer.setSize(width, height);
-            brainRenderer.setPixelRatio(window.devicePixelRatio);
+            brainRenderer.setPixelRatio(brainPixelRatio);
             container.appendChild(brainRenderer.domElement);
 
             brainControls = new OrbitControls(brainCamera, brainRenderer.domElement);
@@ -881,6 +2176,10 @@ def generate_html(science_data, nasa_data):
             brainControls.minDistance = 50;
             brainControls.maxDistance = 300;
             brainControls.enablePan = false;
+            // 궤도 조작에 따른 다시 그리기는 정지 모드에서만 필요합니다. 애니메이션 중에는 다음 tick이 그립니다.
+            brainControls.addEventListener('change', () => {{
+                if (frameScheduler.isStatic()) frameScheduler.invalidate('brain');
+            }});
 
             const renderScene = new RenderPass(brainScene, brainCamera);
             
@@ -893,14 +2192,57 @@ def generate_html(science_data, nasa_data):
             brainComposer.addPass(renderScene);
             brainComposer.addPass(bloomPass);
 
+            brainGroup = new THREE.Group();
+            brainGroup.rotation.x = -Math.PI / 2;
+            brainGroup.rotation.z = Math.PI / 2;
+            brainScene.add(brainGroup);
+
             try {{
-                const response = await fetch('brain.json');
-                const data = await response.json();
-                createDigitalBrain(data);
+                await loadBrainLevel(0);
             }} catch (e) {{ console.error("Brain load fail", e); }}
 
             window.addEventListener('resize', onBrainResize);
-            animateBrain();
+        }}
+
+        async function loadBrainLevel(level) {{
+            if (!brainLevels[level]) brainLevels[level] = createDigitalBrain(await loadBrainMesh(BRAIN_LODS[level]));
+            showBrainLevel(level);
+        }}
+
+        // 스케줄러가 현재 단계의 표본 구간 평균이 예산 안이라고 알릴 때만 한 단계씩 올립니다.
+        function upgradeBrain() {{
+            const next = brainLevel + 1;
+            if (brainUpgrading || brainLevel < 0 || next > brainMaxLevel) return;
+            brainUpgrading = true;
+            loadBrainLevel(next)
+                .catch(e => {{
+                    console.error("Brain LOD load fail", e);
+                    brainMaxLevel = brainLevel;
+                }})
+                .finally(() => {{ brainUpgrading = false; }});
+        }}
+
+        function showBrainLevel(level) {{
+            if (level > brainMaxLevel || level === brainLevel || !brainLevels[level]) return;
+            if (brainLevel >= 0) brainGroup.remove(brainLevels[brainLevel]);
+            brainGroup.add(brainLevels[level]);
+            brainLevel = level;
+            frameScheduler.invalidate('brain');
+        }}
+
+        function degradeBrain() {{
+            if (brainPixelRatio > 1) {{
+                brainPixelRatio = 1;
+                brainRenderer.setPixelRatio(1);
+                brainComposer.setPixelRatio(1);
+                return true;
+            }}
+            if (brainLevel > 0) {{
+                brainMaxLevel = brainLevel - 1;
+                showBrainLevel(brainMaxLevel);
+                return true;
+            }}
+            return false;
         }}
 
         function createCircleTexture() {{
@@ -918,88 +2260,75 @@ def generate_html(science_data, nasa_data):
             return new THREE.CanvasTexture(canvas);
         }}
 
-        function createDigitalBrain(data) {{
-            const tempGeo = new THREE.BufferGeometry();
-            tempGeo.setAttribute('position', new THREE.Float32BufferAttribute(data.vertices.flat(), 3));
-            tempGeo.computeBoundingBox();
-            const center = new THREE.Vector3();
-            tempGeo.boundingBox.getCenter(center);
-            
-            for (let i = 0; i < data.vertices.length; i++) {{
-                const vec = new THREE.Vector3().fromArray(data.vertices[i]);
-                vec.sub(center);
-                data.vertices[i] = vec.toArray();
-            }}
+        async function loadBrainMesh(url) {{
+            // 빌드 단계에서 중심 맞추기/소뇌 축소/모서리 중복 제거를 끝낸 버퍼를 typed-array 뷰로 그대로 씁니다(복사 없음).
+            const buffer = await (await fetch(url)).arrayBuffer();
+            const view = new DataView(buffer);
+            const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+            if (magic !== 'BRNM' || view.getUint16(4, true) !== 2) throw new Error('Unknown brain asset: ' + magic);
+
+            const flags = view.getUint16(6, true);
+            const vertexCount = view.getUint32(8, true);
+            const edgeIndexCount = view.getUint32(12, true);
+            const readVec = (at, n) => Array.from({{ length: n }}, (_, i) => view.getFloat32(at + i * 4, true));
+            const offset = readVec(16, 3);
+            const scale = readVec(28, 3);
+            const sphere = readVec(40, 4);
+
+            let cursor = {BRAIN_HEADER_SIZE};
+            const positions = new Uint16Array(buffer, cursor, vertexCount * 3);
+            cursor = (cursor + positions.byteLength + 3) & ~3;
+            const IndexArray = (flags & 1) ? Uint32Array : Uint16Array;
+            const edges = new IndexArray(buffer, cursor, edgeIndexCount);
+
+            return {{ vertexCount, positions, edges, offset, scale, sphere }};
+        }}
 
-            const CEREBELLUM_ID = 6;
-            const CEREBELLUM_SCALE = 0.85;
-            const cerebellumCenter = new THREE.Vector3();
-            let cerebellumVertexCount = 0;
-            const cerebellumIndices = [];
-
-            if (data.types) {{
-                for (let i = 0; i < data.types.length; i++) {{
-                    if (data.types[i] === CEREBELLUM_ID) {{
-                        const vertex = data.vertices[i];
-                        cerebellumCenter.add(new THREE.Vector3(vertex[0], vertex[1], vertex[2]));
-                        cerebellumVertexCount++;
-                        cerebellumIndices.push(i);
-                    }}
-                }}
-                if (cerebellumVertexCount > 0) {{
-                    cerebellumCenter.divideScalar(cerebellumVertexCount);
-                    for (const i of cerebellumIndices) {{
-                        const vertexVec = new THREE.Vector3().fromArray(data.vertices[i]);
-                        const newPosition = vertexVec.sub(cerebellumCenter).multiplyScalar(CEREBELLUM_SCALE).add(cerebellumCenter);
-                        data.vertices[i] = newPosition.toArray();
-                    }}
-                }}
-            }}
+        function createDigitalBrain(mesh) {{
+            // 정규화된 Uint16 좌표(0~1)를 원래 크기와 위치로 되돌리는 변환은 GPU(모델 행렬)에 맡깁니다.
+            const meshGroup = new THREE.Group();
+            meshGroup.scale.set(...mesh.scale);
+            meshGroup.position.set(...mesh.offset);
 
-            brainGroup = new THREE.Group();
-            brainScene.add(brainGroup);
-
-            const vertices = new Float32Array(data.vertices.flat());
             const geometry = new THREE.BufferGeometry();
-            geometry.setAttribute('position', new THREE.BufferAttribute(vertices, 3));
-            
-            const numVertices = vertices.length / 3;
-            const colors = new Float32Array(numVertices * 3);
-            const baseColor = new THREE.Color().setHSL(0.6, 0.9, 0.6); 
-            for(let i=0; i<numVertices; i++) {{ colors.set([baseColor.r, baseColor.g, baseColor.b], i*3); }}
-            geometry.setAttribute('color', new THREE.BufferAttribute(colors, 3));
-
-            const material = new THREE.PointsMaterial({{
-                size: 0.8,
-                sizeAttenuation: true, 
-                map: createCircleTexture(),
-                vertexColors: true, 
-                transparent: true,
-                blending: THREE.AdditiveBlending, 
-                depthWrite: false
-            }});
+            geometry.setAttribute('position', new THREE.BufferAttribute(mesh.positions, 3, true));
+            geometry.boundingBox = new THREE.Box3(new THREE.Vector3(0, 0, 0), new THREE.Vector3(1, 1, 1));
+            geometry.boundingSphere = new THREE.Sphere(new THREE.Vector3(mesh.sphere[0], mesh.sphere[1], mesh.sphere[2]), mesh.sphere[3]);
+
+            if (!brainMaterials) {{
+                const baseColor = new THREE.Color().setHSL(0.6, 0.9, 0.6); 
+                brainMaterials = {{
+                    points: new THREE.PointsMaterial({{
+                        size: 0.8,
+                        sizeAttenuation: true, 
+                        map: createCircleTexture(),
+                        color: baseColor, 
+                        transparent: true,
+                        blending: THREE.AdditiveBlending, 
+                        depthWrite: false
+                    }}),
+                    lines: new THREE.LineBasicMaterial({{ 
+                        color: 0x99bbff, 
+                        transparent: true, 
+                        opacity: 0.15, 
+                        blending: THREE.AdditiveBlending, 
+                        depthWrite: false 
+                    }})
+                }};
+            }}
 
-            const points = new THREE.Points(geometry, material);
-            brainGroup.add(points);
+            const points = new THREE.Points(geometry, brainMaterials.points);
+            meshGroup.add(points);
             
             const lineGeo = new THREE.BufferGeometry();
             lineGeo.setAttribute('position', geometry.getAttribute('position'));
-            lineGeo.setIndex(data.faces.flat());
-            
-            const lineMaterial = new THREE.LineBasicMaterial({{ 
-                color: 0x99bbff, 
-                transparent: true, 
-                opacity: 0.15, 
-                blending: THREE.AdditiveBlending, 
-                depthWrite: false 
-            }});
+            lineGeo.setIndex(new THREE.BufferAttribute(mesh.edges, 1));
+            lineGeo.boundingBox = geometry.boundingBox;
+            lineGeo.boundingSphere = geometry.boundingSphere;
             
-            const wireframe = new THREE.WireframeGeometry(lineGeo);
-            const lines = new THREE.LineSegments(wireframe, lineMaterial);
-            brainGroup.add(lines);
-
-            brainGroup.rotation.x = -Math.PI / 2;
-            brainGroup.rotation.z = Math.PI / 2;
+            const lines = new THREE.LineSegments(lineGeo, brainMaterials.lines);
+            meshGroup.add(lines);
+            return meshGroup;
         }}
 
         function onBrainResize() {{
@@ -1008,71 +2337,105 @@ def generate_html(science_data, nasa_data):
             const w = container.clientWidth; const h = container.clientHeight;
             brainCamera.aspect = w / h; brainCamera.updateProjectionMatrix();
             brainRenderer.setSize(w, h); brainComposer.setSize(w, h);
+            frameScheduler.invalidate('brain');
         }}
 
-        function animateBrain() {{
-            animationIdBrain = requestAnimationFrame(animateBrain);
-            if(brainControls) brainControls.update();
-            if(brainGroup) brainGroup.rotation.z += 0.005;
-            if(brainComposer) brainComposer.render();
+        function animateBrain(dt) {{
+            // 메쉬가 올라오기 전에는 블룸 합성을 돌리지 않습니다.
+            if (brainLevel < 0) return;
+            brainControls.update();
+            brainGroup.rotation.z += 0.005 * dt / FRAME_MS;
+            brainComposer.render();
         }}
 
-        let animationIdDNA;
-        let dnaDots = [];
+        // DNA 나선은 캔버스 한 장에 그립니다. 점과 가로줄은 미리 그려 둔 스프라이트를 drawImage로 찍으므로
+        // 프레임마다 레이아웃이 일어나지 않고, 행 수(DNA_ROWS)를 늘려도 비용은 drawImage 횟수만큼만 늘어납니다.
+        const DNA_ROWS = 20;
+        const DNA_WIDTH = 240, DNA_HEIGHT = 320;
+        const DNA_RADIUS = 60;
+        // 나선 전체의 꼬임(라디안). 행 수와 무관하게 같은 모양이 되도록 행 간격 각도는 이 값을 나눠 씁니다.
+        const DNA_TWIST = 0.32 * 20;
+        const DNA_DOT_SPRITE = 48, DNA_DOT_CORE = 16;
+        let dnaCtx = null, dnaDotSprite, dnaLineSprite;
+        let dnaPhase = 0;
+
+        function createDNASprites() {{
+            dnaDotSprite = document.createElement('canvas');
+            dnaDotSprite.width = dnaDotSprite.height = DNA_DOT_SPRITE;
+            const dotCtx = dnaDotSprite.getContext('2d');
+            const c = DNA_DOT_SPRITE / 2, r = DNA_DOT_CORE / 2;
+            const dot = dotCtx.createRadialGradient(c, c, 0, c, c, r * Math.SQRT2);
+            dot.addColorStop(0, 'rgba(255, 255, 255, 1)');
+            dot.addColorStop(0.3, 'rgba(0, 170, 255, 1)');
+            dot.addColorStop(0.7, 'rgba(0, 80, 255, 0.1)');
+            dot.addColorStop(1, 'rgba(0, 80, 255, 0)');
+            dotCtx.shadowColor = 'rgba(0, 170, 255, 0.8)';
+            dotCtx.shadowBlur = DNA_DOT_CORE;
+            dotCtx.fillStyle = dot;
+            dotCtx.beginPath();
+            dotCtx.arc(c, c, r, 0, Math.PI * 2);
+            dotCtx.fill();
+
+            dnaLineSprite = document.createElement('canvas');
+            dnaLineSprite.width = 64;
+            dnaLineSprite.height = 1;
+            const lineCtx = dnaLineSprite.getContext('2d');
+            const line = lineCtx.createLinearGradient(0, 0, 64, 0);
+            line.addColorStop(0, 'rgba(153, 187, 255, 0)');
+            line.addColorStop(0.5, 'rgba(153, 187, 255, 1)');
+            line.addColorStop(1, 'rgba(153, 187, 255, 0)');
+            lineCtx.fillStyle = line;
+            lineCtx.fillRect(0, 0, 64, 1);
+        }}
 
         function initDNA() {{
-            const dnaBox = document.getElementById('dna-animation-box');
-            if (dnaDots.length > 0) return; 
-            const totalRows = 20;
-            const waveGap = 0.32;
-            for (let i = 0; i < totalRows; i++) {{
-                const dot1 = document.createElement('div');
-                const dot2 = document.createElement('div');
-                const line = document.createElement('div');
-                dot1.className = 'dna-dot';
-                dot2.className = 'dna-dot';
-                line.className = 'dna-line';
-                dnaBox.appendChild(dot1);
-                dnaBox.appendChild(dot2);
-                dnaBox.appendChild(line);
-                dnaDots.push({{ dot1, dot2, line, angle: i * waveGap }});
-            }}
+            if (dnaCtx) return;
+            const canvas = document.getElementById('dna-animation-box');
+            const dpr = Math.min(window.devicePixelRatio || 1, 2);
+            canvas.width = DNA_WIDTH * dpr;
+            canvas.height = DNA_HEIGHT * dpr;
+            dnaCtx = canvas.getContext('2d');
+            dnaCtx.setTransform(dpr, 0, 0, dpr, 0, 0);
+            createDNASprites();
         }}
 
-        function animateDNA() {{
-            const speed = 0.014;
-            const radius = 60;
-            const centerX = 120;
-            const centerYOffset = 0;
-
-            dnaDots.forEach((row, i) => {{
-                row.angle += speed;
-                const x1 = Math.sin(row.angle) * radius + centerX;
-                const x2 = Math.sin(row.angle + Math.PI) * radius + centerX;
-                const z1 = Math.cos(row.angle);
-                const z2 = Math.cos(row.angle + Math.PI);
-                const y = (i * 17) + centerYOffset;
-                const scale1 = (z1 + 2) * 2.5;
-                const scale2 = (z2 + 2) * 2.5;
-                const opacity1 = (z1 + 1.2) / 2.2;
-                const opacity2 = (z2 + 1.2) / 2.2;
-
-                row.dot1.style.transform = `translate(${{x1}}px, ${{y}}px)`;
-                row.dot1.style.width = scale1 + 'px';
-                row.dot1.style.height = scale1 + 'px';
-                row.dot1.style.opacity = opacity1;
-                row.dot2.style.transform = `translate(${{x2}}px, ${{y}}px)`;
-                row.dot2.style.width = scale2 + 'px';
-                row.dot2.style.height = scale2 + 'px';
-                row.dot2.style.opacity = opacity2;
-
-                const lineWidth = Math.abs(x1 - x2);
-                row.line.style.width = lineWidth + 'px';
-                row.line.style.left = Math.min(x1, x2) + (scale1 / 2) + 'px';
-                row.line.style.top = y + (scale1 / 2) + 'px';
-                row.line.style.opacity = Math.min(opacity1, opacity2) * 0.8;
-            }});
-            animationIdDNA = requestAnimationFrame(animateDNA);
+        function animateDNA(dt) {{
+            if (!dnaCtx) return;
+            dnaPhase += 0.014 * dt / FRAME_MS;
+            const centerX = DNA_WIDTH / 2;
+            const rowGap = DNA_HEIGHT / DNA_ROWS;
+            const waveGap = DNA_TWIST / DNA_ROWS;
+            const spriteScale = DNA_DOT_SPRITE / DNA_DOT_CORE;
+
+            dnaCtx.clearRect(0, 0, DNA_WIDTH, DNA_HEIGHT);
+            for (let pass = 0; pass < 2; pass++) {{
+                // 가로줄을 먼저 깔고, 점은 screen 합성으로 그 위에 겹칩니다.
+                dnaCtx.globalCompositeOperation = pass === 0 ? 'source-over' : 'screen';
+                for (let i = 0; i < DNA_ROWS; i++) {{
+                    const angle = dnaPhase + i * waveGap;
+                    const offset = Math.sin(angle) * DNA_RADIUS;
+                    const z = Math.cos(angle);
+                    const x1 = centerX + offset, x2 = centerX - offset;
+                    const y = i * rowGap;
+                    const scale1 = (z + 2) * 2.5;
+                    const scale2 = (2 - z) * 2.5;
+                    const opacity1 = (z + 1.2) / 2.2;
+                    const opacity2 = (1.2 - z) / 2.2;
+
+                    if (pass === 0) {{
+                        dnaCtx.globalAlpha = Math.min(opacity1, opacity2) * 0.8;
+                        dnaCtx.drawImage(dnaLineSprite, Math.min(x1, x2) + scale1 / 2, y + scale1 / 2, Math.abs(x1 - x2), 1);
+                        continue;
+                    }}
+                    const size1 = scale1 * spriteScale, size2 = scale2 * spriteScale;
+                    dnaCtx.globalAlpha = opacity1;
+                    dnaCtx.drawImage(dnaDotSprite, x1 + (scale1 - size1) / 2, y + (scale1 - size1) / 2, size1, size1);
+                    dnaCtx.globalAlpha = opacity2;
+                    dnaCtx.drawImage(dnaDotSprite, x2 + (scale2 - size2) / 2, y + (scale2 - size2) / 2, size2, size2);
+                }}
+            }}
+            dnaCtx.globalAlpha = 1;
+            dnaCtx.globalCompositeOperation = 'source-over';
         }}
 
         const brainContainer = document.getElementById('brain-container');
@@ -1085,10 +2448,6 @@ def generate_html(science_data, nasa_data):
             currentField = f;
             currentType = (f === "천문·우주") ? "apod" : "news";
             
-            if (animationIdUniverse) cancelAnimationFrame(animationIdUniverse);
-            if (animationIdBrain) cancelAnimationFrame(animationIdBrain);
-            if (animationIdDNA) cancelAnimationFrame(animationIdDNA);
-
             universeContainer.style.display = 'none';
             brainContainer.style.display = 'none';
             universeContent.style.display = 'none';
@@ -1098,7 +2457,6 @@ def generate_html(science_data, nasa_data):
             if (f === "천문·우주") {{
                 universeContainer.style.display = 'block';
                 universeContent.style.display = 'block';
-                animateUniverse();
             
             }} else if (f === "인지·신경") {{
                 universeContent.style.display = 'none';
@@ -1107,7 +2465,6 @@ def generate_html(science_data, nasa_data):
                     initBrain();
                 }} else {{
                     onBrainResize();
-                    animateBrain(); 
                 }}
                 
             }} else if (f === "물리학") {{
@@ -1116,9 +2473,12 @@ def generate_html(science_data, nasa_data):
             }} else if (f === "생명과학") {{
                 document.getElementById('dna-outer-container').style.display = 'flex'; 
                 initDNA();
-                animateDNA();
             }}
 
+            frameScheduler.setActive('universe', f === "천문·우주");
+            frameScheduler.setActive('brain', f === "인지·신경");
+            frameScheduler.setActive('dna', f === "생명과학");
+
             document.querySelectorAll('.tab-btn').forEach(b => b.classList.toggle('active', b.innerText === f));
             
             renderSubTabs();
@@ -1149,103 +2509,162 @@ def generate_html(science_data, nasa_data):
             `).join('');
         }}
 
-        function render() {{
-            const science = fullData.science[currentField] || {{ news: [], videos: [], papers: [], reviews: [], data: [] }};
-            const nasa = fullData.nasa;
-            const container = document.getElementById('main-content');
-            let html = '';
-
-            if (currentType === 'apod') {{
-                if (nasa) {{
-                    html += `
-                    <div class="nasa-hero">
-                        <img src="${{nasa.url}}" class="nasa-img" alt="NASA APOD">
-                        <div class="nasa-info">
-                            <div class="nasa-header-row">
-                                <span class="nasa-tag">NASA APOD TODAY</span>
-                                <div class="nasa-actions">
-                                    <a href="${{nasa.hdurl || nasa.url}}" target="_blank" class="btn-mini">HD 보기</a>
-                                    <a href="https://apod.nasa.gov/apod/astropix.html" target="_blank" class="btn-mini">NASA 원본</a>
-                                </div>
-                            </div>
-                            <div class="nasa-title">${{nasa.title}}</div>
-                            <p class="nasa-desc">${{nasa.explanation}}</p>
-                            <div class="nasa-credit">
-                                <strong>Image Credit & Copyright:</strong> ${{nasa.copyright || 'Public Domain'}} | <strong>Date:</strong> ${{nasa.date}}
-                            </div>
-                        </div>
-                    </div>`;
-                }} else html += `<div style="text-align:center; padding:50px; color:#666;">NASA 데이터를 불러올 수 없습니다.</div>`;
-            
-            }} else if (currentType === 'news') {{
-                const newsList = science.news || [];
-                if (newsList.length === 0) html = '<div style="text-align:center; padding:50px;">관련 뉴스가 없습니다.</div>';
-                else html = '<div class="card-grid">' + newsList.map(n => `
+        // 카드 목록 한 종류를 그리는 방법: 비었을 때 문구와 카드 한 장의 HTML입니다.
+        const CARD_VIEWS = {{
+            news: {{
+                empty: () => '<div style="text-align:center; padding:50px;">관련 뉴스가 없습니다.</div>',
+                card: (n, field) => `
                     <a href="${{n.link}}" target="_blank" class="card">
                         <span class="source-tag">${{n.source}}</span>
-                        <span class="ai-tag">#${{currentField}}</span>
+                        <span class="ai-tag">#${{field}}</span>
                         <div class="card-title">${{n.title}}</div>
                         <div class="card-meta">${{n.date}}</div>
-                    </a>`).join('') + '</div>';
-            
-            }} else if (currentType === 'videos') {{
-                const videoList = science.videos || [];
-                if (videoList.length === 0) html = '<div style="text-align:center; padding:50px;">관련 영상이 없습니다.</div>';
-                else html = '<div class="card-grid">' + videoList.map(v => `
+                    </a>`
+            }},
+            videos: {{
+                empty: () => '<div style="text-align:center; padding:50px;">관련 영상이 없습니다.</div>',
+                card: v => `
                     <a href="${{v.link}}" target="_blank" class="card video-card">
                         <div class="thumb-wrapper">
-                            <img src="${{v.thumbnail}}" class="thumb-img">
+                            <img src="${{v.thumbnail}}" class="thumb-img" loading="lazy" decoding="async" alt="">
                             <div class="play-icon"></div>
                         </div>
                         <span class="source-tag">${{v.source}}</span>
                         <div class="card-title">${{v.title}}</div>
                         <div class="card-meta">${{new Date(v.date).toISOString().split('T')[0]}}</div>
-                    </a>`).join('') + '</div>';
-            
-            }} else if (currentType === 'papers') {{
-                const list = science.papers || [];
-                if (list.length > 0) {{
-                     html = '<div class="card-grid">' + list.map(p => `
-                        <a href="${{p.link}}" target="_blank" class="card">
-                            <span class="source-tag">${{p.source}}</span>
-                            <span class="ai-tag">#Journal</span>
-                            <div class="card-title">${{p.title}}</div>
-                            <div class="card-meta">${{p.date || ''}}</div>
-                        </a>`).join('') + '</div>';
+                    </a>`
+            }},
+            papers: {{
+                empty: field => `<div style="padding:100px; text-align:center; color:#666;">${{field}} 분야의 논문 정보를 준비 중입니다.</div>`,
+                card: p => `
+                    <a href="${{p.link}}" target="_blank" class="card">
+                        <span class="source-tag">${{p.source}}</span>
+                        <span class="ai-tag">#Journal</span>
+                        <div class="card-title">${{p.title}}</div>
+                        <div class="card-meta">${{p.date || ''}}</div>
+                    </a>`
+            }},
+            reviews: {{
+                empty: () => '<div style="text-align:center; padding:50px;">수집된 리뷰 논문이 없습니다.</div>',
+                card: r => `
+                    <a href="${{r.link}}" target="_blank" class="card">
+                        <span class="source-tag">${{r.source}}</span>
+                        <span class="ai-tag">#리뷰_저널</span>
+                        <div class="card-title">${{r.title}}</div>
+                        <div class="card-meta">${{r.date}}</div>
+                    </a>`
+            }},
+            data: {{
+                empty: () => '<div style="padding:100px; text-align:center; color:#666;">데이터 정보를 준비 중입니다.</div>',
+                card: p => `
+                    <a href="${{p.link}}" target="_blank" class="card">
+                        <span class="source-tag">${{p.source}}</span>
+                        <div class="card-title">${{p.title}}</div>
+                        <div class="card-desc" style="font-size:0.9rem; color:#888;">${{p.desc}}</div>
+                    </a>`
+            }}
+        }};
+
+        // (분야, 종류)별로 만든 DOM 트리를 보관했다가 다시 방문하면 그대로 붙입니다.
+        // 긴 목록은 CARD_CHUNK장씩만 만들고, 그리드 끝의 센티널이 화면에 가까워지면 다음 묶음을 이어 붙입니다.
+        const CARD_CHUNK = 24;
+        const viewCache = new Map();
+        const pendingChunks = new WeakMap();
+        const chunkObserver = new IntersectionObserver(entries => {{
+            for (const entry of entries) {{
+                if (entry.isIntersecting) pendingChunks.get(entry.target)();
+            }}
+        }}, {{ rootMargin: '800px 0px' }});
+
+        function buildCardView(key, list, field) {{
+            const view = CARD_VIEWS[key];
+            const root = document.createElement('div');
+            if (!list || list.length === 0) {{
+                root.innerHTML = view.empty(field);
+                return root;
+            }}
+
+            const grid = document.createElement('div');
+            grid.className = 'card-grid';
+            const sentinel = document.createElement('div');
+            root.append(grid, sentinel);
+
+            let next = 0;
+            const appendChunk = () => {{
+                const end = Math.min(next + CARD_CHUNK, list.length);
+                grid.insertAdjacentHTML('beforeend', list.slice(next, end).map(item => view.card(item, field)).join(''));
+                next = end;
+                // 다시 관찰을 걸면 즉시 한 번 통지되므로, 센티널이 여전히 보이면 다음 묶음이 이어서 붙습니다.
+                chunkObserver.unobserve(sentinel);
+                if (next < list.length) {{
+                    chunkObserver.observe(sentinel);
                 }} else {{
-                    html = `<div style="padding:100px; text-align:center; color:#666;">${{currentField}} 분야의 논문 정보를 준비 중입니다.</div>`;
+                    pendingChunks.delete(sentinel);
+                    sentinel.remove();
                 }}
+            }};
+            pendingChunks.set(sentinel, appendChunk);
+            appendChunk();
+            return root;
+        }}
 
-                }} else if (currentType === 'Reviews Paper') {{
-        const reviewList = science.reviews || []; // Python에서 넘겨준 reviews 데이터를 가져옴
-        if (reviewList.length === 0) {{
-            html = '<div style="text-align:center; padding:50px;">수집된 리뷰 논문이 없습니다.</div>';
-        }} else {{
-            html = '<div class="card-grid">' + reviewList.map(r => `
-                <a href="${{r.link}}" target="_blank" class="card">
-                    <span class="source-tag">${{r.source}}</span>
-                    <span class="ai-tag">#리뷰_저널</span>
-                    <div class="card-title">${{r.title}}</div>
-                    <div class="card-meta">${{r.date}}</div>
-                </a>`).join('') + '</div>';
+        function buildApodView(nasa) {{
+            const root = document.createElement('div');
+            if (!nasa) {{
+                root.innerHTML = `<div style="text-align:center; padding:50px; color:#666;">NASA 데이터를 불러올 수 없습니다.</div>`;
+                return root;
+            }}
+            root.innerHTML = `
+                <div class="nasa-hero">
+                    <img src="${{nasa.url}}" class="nasa-img" alt="NASA APOD" decoding="async">
+                    <div class="nasa-info">
+                        <div class="nasa-header-row">
+                            <span class="nasa-tag">NASA APOD TODAY</span>
+                            <div class="nasa-actions">
+                                <a href="${{nasa.hdurl || nasa.url}}" target="_blank" class="btn-mini">HD 보기</a>
+                                <a href="https://apod.nasa.gov/apod/astropix.html" target="_blank" class="btn-mini">NASA 원본</a>
+                            </div>
+                        </div>
+                        <div class="nasa-title">${{nasa.title}}</div>
+                        <p class="nasa-desc">${{nasa.explanation}}</p>
+                        <div class="nasa-credit">
+                            <strong>Image Credit & Copyright:</strong> ${{nasa.copyright || 'Public Domain'}} | <strong>Date:</strong> ${{nasa.date}}
+                        </div>
+                    </div>
+                </div>`;
+            return root;
         }}
 
-            }} else if (currentType === 'data') {{
-                const list = science.data || [];
-                if (list.length > 0) {{
-                     html = '<div class="card-grid">' + list.map(p => `
-                        <a href="${{p.link}}" target="_blank" class="card">
-                            <span class="source-tag">${{p.source}}</span>
-                            <div class="card-title">${{p.title}}</div>
-                            <div class="card-desc" style="font-size:0.9rem; color:#888;">${{p.desc}}</div>
-                        </a>`).join('') + '</div>';
-                }} else {{
-                    html = `<div style="padding:100px; text-align:center; color:#666;">데이터 정보를 준비 중입니다.</div>`;
-                }}
+        async function render() {{
+            // 선택된 분야/종류의 조각만 그때 가져옵니다. 기다리는 사이 탭이 바뀌면 이 렌더는 버립니다.
+            const token = ++renderToken;
+            const field = currentField;
+            const key = currentType === 'apod' ? 'apod' : TYPE_KEYS[currentType];
+            const container = document.getElementById('main-content');
+            const cacheKey = `${{field}}|${{key}}`;
+            let view = viewCache.get(cacheKey);
+
+            if (!view) {{
+                let url = null, shard = null, loaded = false;
+                try {{
+                    const shardUrls = await loadManifest();
+                    url = key === 'apod' ? shardUrls.nasa : (shardUrls.science[field] || {{}})[key];
+                    shard = await loadShard(url);
+                    loaded = true;
+                }} catch (e) {{ console.error("Shard load fail", url, e); }}
+                if (token !== renderToken) return;
+
+                view = key === 'apod' ? buildApodView(shard) : buildCardView(key, shard, field);
+                // 목록이나 조각을 못 불러온 경우는 다음 방문 때 다시 시도하도록 캐시하지 않습니다.
+                if (loaded) viewCache.set(cacheKey, view);
             }}
-            container.innerHTML = html;
+            container.replaceChildren(view);
         }}
 
+        frameScheduler.register('universe', {{ element: universeContainer, fps: 30, tick: animateUniverse, degrade: degradeUniverse }});
+        frameScheduler.register('brain', {{ element: brainContainer, fps: 60, tick: animateBrain, degrade: degradeBrain, upgrade: upgradeBrain }});
+        frameScheduler.register('dna', {{ element: dnaContainer, fps: 30, tick: animateDNA }});
+
         initUniverse();
         window.showField('천문·우주');
         
@@ -1255,10 +2674,28 @@ def generate_html(science_data, nasa_data):
     """
 
 if __name__ == "__main__":
+    manifest = load_build_manifest()
+    build_if_changed(manifest, BRAIN_LOD_ASSETS, brain_assets_fingerprint(), build_brain_assets)
+
     nasa_info = get_nasa_data()
     science_info = collect_and_process_data()
-    
-    with open("index.html", "w", encoding="utf-8") as f:
-        f.write(generate_html(science_info, nasa_info))
-    
-    print("성공: index.html이 생성되었습니다.")
+    shard_manifest = write_data_shards(science_info, nasa_info)
+
+    def write_index():
+        with open("index.html", "w", encoding="utf-8") as f:
+            f.write(minify_html(generate_html()))
+        print("성공: index.html이 생성되었습니다.")
+
+    page_inputs = fingerprint(inspect.getsource(generate_html), inspect.getsource(minify_html), inspect.getsource(minify_css), SHARD_MANIFEST, SCIENCE_FIELDS, BRAIN_LOD_ASSETS, BRAIN_HEADER_SIZE)
+    build_if_changed(manifest, ["index.html"], page_inputs, write_index)
+
+    shard_paths = [shard_manifest["nasa"]] + [url for urls in shard_manifest["science"].values() for url in urls.values()]
+    precompress(["index.html", SHARD_MANIFEST] + BRAIN_LOD_ASSETS + sorted(set(shard_paths)))
+
+    # DB 내용이 그대로면 워크플로가 바이너리 DB 파일을 커밋하지 않도록 알립니다.
+    db_hash = db_fingerprint()
+    db_changed = db_hash != manifest.get("db")
+    manifest["db"] = db_hash
+    save_build_manifest(manifest)
+    write_github_output(db_changed=str(db_changed).lower())
+    print(f"DB 변경: {'있음' if db_changed else '없음'}")